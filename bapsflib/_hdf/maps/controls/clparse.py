@@ -163,35 +163,39 @@ class CLParse(object):
                     continue
 
             # search for pattern
+            # - bind the pattern and output lists locally since they
+            #   are used for every command
+            search = cls_dict[name]['re pattern'].search
+            name_cl = cls_dict[name]['command list']
+            name_cl_str = cls_dict[name]['cl str']
             r_cl = []
             for command in cls_dict['remainder']['command list']:
-                results = cls_dict[name]['re pattern'].search(command)
+                results = search(command)
                 if results is not None:
+                    val_str, cl_str = results.group('VAL', name)
+
                     # try to convert the 'VAL' string into float
                     # - for now, assuming 'VAL' will always be a float
                     #   or string, NEVER an integer
                     try:
-                        value = float(results.group('VAL'))
+                        value = float(val_str)
                     except ValueError:
-                        value = results.group('VAL')  # type: str
-                        value = value.strip()
+                        value = val_str.strip()  # type: str
                         if value == '':
                             value = None
 
                     # add to command list
-                    cls_dict[name]['command list'].append(value)
-                    cls_dict[name]['cl str'].append(
-                        results.group(name))
+                    name_cl.append(value)
+                    name_cl_str.append(cl_str)
 
                     # make a new remainder command list
-                    stripped_cmd = command.replace(
-                        results.group(name), '').strip()
+                    stripped_cmd = command.replace(cl_str, '').strip()
                     if stripped_cmd == '':
                         stripped_cmd = None
                     r_cl.append(stripped_cmd)
                 else:
-                    cls_dict[name]['command list'].append(None)
-                    cls_dict[name]['cl str'].append(None)
+                    name_cl.append(None)
+                    name_cl_str.append(None)
 
             # update remainder command list
             # - only if the above 'command list' build does NOT produce
@@ -16,7 +16,7 @@ from bapsflib.utils.errors import HDFMappingError
 from warnings import warn
 
 from .contype import ConType
-from .templates import HDFMapControlCLTemplate
+from .templates import (_as_str, HDFMapControlCLTemplate)
 
 
 class HDFMapControlN5700PS(HDFMapControlCLTemplate):
@@ -59,6 +59,23 @@ class HDFMapControlN5700PS(HDFMapControlCLTemplate):
             why = 'has no mappable configurations'
             raise HDFMappingError(self._info['group path'], why=why)
 
+        # get dataset
+        # - the dataset is shared by all configurations
+        try:
+            dset = self.group[self.construct_dataset_name()]
+        except KeyError:
+            why = ("Dataset '" + self.construct_dataset_name()
+                   + "' not found")
+            raise HDFMappingError(self._info['group path'], why=why)
+
+        # general info values (attribute name pairs)
+        pairs = [
+            ('IP address', 'IP address'),
+            ('power supply device', 'Model Number'),
+            ('initial state', 'Initialization commands'),
+            ('command list', 'N5700 power supply command list')
+        ]
+
         # build configuration dictionaries
         # - assume every sub-group represents a unique configuration
         #   to the control device
@@ -67,32 +84,19 @@ class HDFMapControlN5700PS(HDFMapControlCLTemplate):
         # - assume all configurations are active (i.e. used)
         #
         for name in self.subgroup_names:
-            # get configuration group
-            cong = self.group[name]
-
-            # get dataset
-            try:
-                dset = self.group[self.construct_dataset_name()]
-            except KeyError:
-                why = ("Dataset '" + self.construct_dataset_name()
-                       + "' not found configuration group '"
-                       + name + "'")
-                raise HDFMappingError(self._info['group path'], why=why)
+            # get configuration group attributes
+            # - all attributes are read in one pass over the group
+            #   instead of opening them one at a time
+            cong_attrs = dict(self.group[name].attrs.items())
 
             # initialize _configs
             self._configs[name] = {}
 
             # ---- define general info values                       ----
-            pairs = [
-                ('IP address', 'IP address'),
-                ('power supply device', 'Model Number'),
-                ('initial state', 'Initialization commands'),
-                ('command list', 'N5700 power supply command list')
-            ]
             for pair in pairs:
                 try:
                     # get attribute value
-                    val = cong.attrs[pair[1]]
+                    val = cong_attrs[pair[1]]
 
                     # condition value
                     if pair[0] == 'command list':
@@ -100,15 +104,15 @@ class HDFMapControlN5700PS(HDFMapControlCLTemplate):
                         # - split line returns
                         # - remove trailing/leading whitespace
                         #
-                        val = val.decode('utf-8').splitlines()
+                        val = _as_str(val).splitlines()
                         val = tuple([cls.strip() for cls in val])
                     else:
                         # pair[0] in ('IP address',
                         #             'power supply device',
                         #             'initial state'):
-                        # - val is a np.bytes_ string
+                        # - val is a np.bytes_ (or str) string
                         #
-                        val = val.decode('utf-8')
+                        val = _as_str(val)
 
                     # assign val to _configs
                     self._configs[name][pair[0]] = val
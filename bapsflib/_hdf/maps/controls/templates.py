@@ -20,6 +20,24 @@ from .clparse import CLParse
 from .contype import ConType
 
 
+def _as_str(val) -> str:
+    """
+    Return an HDF5 string attribute value as :class:`str`.  h5py
+    returns fixed-length strings as :class:`numpy.bytes_` and
+    variable-length strings as :class:`str`.
+
+    :raises TypeError: if **val** is neither a :class:`str` nor a
+        :class:`bytes` string
+    """
+    if isinstance(val, (bytes, np.bytes_)):
+        return val.decode('utf-8')
+    elif isinstance(val, str):
+        return val
+    else:
+        raise TypeError(
+            "expected a str or bytes string, got {}".format(type(val)))
+
+
 class HDFMapControlTemplate(ABC):
     # noinspection PySingleQuotedDocstring
     '''
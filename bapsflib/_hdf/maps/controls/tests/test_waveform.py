@@ -93,6 +93,22 @@ class TestWaveform(ControlTestCase):
             _map = self.map
         self.mod.knobs.reset()
 
+        # string attributes stored as variable-length str (not
+        # np.bytes_) are mapped the same
+        config_name = self.mod.config_names[0]
+        self.mod[config_name].attrs['IP address'] = '192.168.1.1'
+        _map = self.map
+        self.assertEqual(_map.configs[config_name]['IP address'],
+                         '192.168.1.1')
+        self.mod.knobs.reset()
+
+        # a non-string value for a string attribute raises TypeError
+        config_name = self.mod.config_names[0]
+        self.mod[config_name].attrs['IP address'] = np.uint32(5)
+        with self.assertRaises(TypeError):
+            _map = self.map
+        self.mod.knobs.reset()
+
         # '_construct_state_values_dict' throws KeyError when executing
         # '_build_configs'
         # - default dict is used for state values
@@ -47,7 +47,9 @@ class DigitizerTestCase(ut.TestCase):
         super().setUpClass()
 
         # create HDF5 file
-        cls.f = FauxHDFBuilder()
+        # - the mapping tests never re-open the file by name, so keep
+        #   it in memory to avoid disk I/O on every group mutation
+        cls.f = FauxHDFBuilder(driver='core', backing_store=False)
 
     def setUp(self):
         # setup HDF5 file
@@ -442,9 +444,6 @@ class DigitizerTestCase(ut.TestCase):
         Test equality of mapped adc connections and expected
         adc connections.
         """
-        map_conns = _map.configs[config_name][adc]
-        filter_conns = []
-        for conn in map_conns:
-            filter_conns.append((conn[0], conn[1]))
-        map_conns = tuple(filter_conns)
+        map_conns = tuple((conn[0], conn[1])
+                          for conn in _map.configs[config_name][adc])
         self.assertEqual(map_conns, connections)
@@ -47,8 +47,11 @@ class FauxSIS3301(h5py.Group):
                 if val.shape == (13, 8) \
                         and np.issubdtype(val.dtype, np.bool) \
                         and np.any(val):
-                    self._faux._active_brdch = val
-                    self._faux._update()
+                    if not np.array_equal(val, self._faux._active_brdch):
+                        # store a copy so later in-place edits of `val`
+                        # are seen as a change on the next set
+                        self._faux._active_brdch = val.copy()
+                        self._faux._update()
                 else:
                     warn('`val` not valid, no update performed')
             else:
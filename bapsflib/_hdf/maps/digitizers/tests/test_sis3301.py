@@ -11,67 +11,207 @@
 # License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
 #   license terms and contributor agreement.
 #
+import h5py
 import numpy as np
 import unittest as ut
 
 from bapsflib.utils.errors import HDFMappingError
+from contextlib import (contextmanager, ExitStack)
 from numpy.lib import recfunctions as rfn
 from unittest import mock
 
 from .common import DigitizerTestCase
 from ..sis3301 import HDFMapDigiSIS3301
 
-
-class TestSIS3301(DigitizerTestCase):
-    """Test class for HDFMapDigiSIS3301"""
+# structured dtypes for the malformed datasets of the warning scenarios
+_DT_TWO_I16 = np.dtype([('f1', np.int16), ('f2', np.int16)])
+_DT_SHOT_F32 = np.dtype([('Shot', np.float32)])
+_DT_SHOT_U32_2 = np.dtype([('Shot', np.uint32, 2)])
+
+
+def _conn_index(_map: HDFMapDigiSIS3301, config_name: str,
+                adc: str) -> dict:
+    """
+    Index the adc connections of configuration **config_name** by board
+    number, i.e. :code:`{brd: (chs, info)}`.
+    """
+    return {conn[0]: (conn[1], conn[2])
+            for conn in _map.configs[config_name][adc]}
+
+
+def _dset_names(config_name: str, brd: int, ch: int) -> (str, str):
+    """
+    Return the names of the data and header datasets for the
+    board-channel pair (**brd**, **ch**) of configuration
+    **config_name**.
+    """
+    dset_name = '{0} [{1}:{2}]'.format(config_name, brd, ch)
+    return dset_name, dset_name + ' headers'
+
+
+def _repeat_last_rows(arr: np.ndarray, n: int) -> np.ndarray:
+    """
+    Return a copy of **arr** extended along axis 0 by repeating its
+    last **n** rows.
+    """
+    nrows = arr.shape[0]
+    out = np.empty((nrows + n,) + arr.shape[1:], dtype=arr.dtype)
+    out[:nrows] = arr
+    out[nrows:] = arr[-n:]
+    return out
+
+
+@contextmanager
+def replaced_dataset(parent: h5py.Group, name: str, new_data):
+    """
+    Context manager that temporarily replaces dataset **name** in
+    group **parent** with a dataset built from **new_data**.  The
+    original dataset is re-created on exit.
+    """
+    orig_data = parent[name][...]
+    del parent[name]
+    parent.create_dataset(name, data=new_data)
+    try:
+        yield parent[name]
+    finally:
+        del parent[name]
+        parent.create_dataset(name, data=orig_data)
+
+
+@contextmanager
+def _renamed(parent: h5py.Group, src: str, tmp: str):
+    """
+    Context manager that temporarily renames member **src** of group
+    **parent** to **tmp**.  The original name is restored on exit.
+    """
+    parent.move(src, tmp)
+    try:
+        yield
+    finally:
+        parent.move(tmp, src)
+
+
+@contextmanager
+def _missing_attr(obj, name: str):
+    """
+    Context manager that temporarily deletes attribute **name** of HDF5
+    object **obj**.  The attribute is restored on exit.
+    """
+    orig_value = obj.attrs[name]
+    del obj.attrs[name]
+    try:
+        yield orig_value
+    finally:
+        obj.attrs[name] = orig_value
+
+
+@contextmanager
+def swap_attr(obj, name: str, new_value):
+    """
+    Context manager that temporarily sets attribute **name** of HDF5
+    object **obj** to **new_value**.  The original value is restored
+    on exit.
+    """
+    orig_value = obj.attrs[name]
+    obj.attrs[name] = new_value
+    try:
+        yield orig_value
+    finally:
+        obj.attrs[name] = orig_value
+
+
+class SIS3301TestCase(DigitizerTestCase):
+    """Base TestCase for the HDFMapDigiSIS3301 test classes."""
 
     DEVICE_NAME = 'SIS 3301'
     DEVICE_PATH = '/Raw data + config/' + DEVICE_NAME
     MAP_CLASS = HDFMapDigiSIS3301
 
+    @classmethod
+    def setUpClass(cls):
+        # skip tests if in SIS3301TestCase
+        if cls is SIS3301TestCase:
+            raise ut.SkipTest("In SIS3301TestCase, "
+                              "skipping base tests")
+        super().setUpClass()
+
     def setUp(self):
         super().setUp()
 
+        # activate the default board-channel connections
+        self.my_bcs = [(0, (0, 3, 5)),
+                       (3, (0, 1, 2, 3)),
+                       (5, (5, 6, 7))]
+        self._activate_bcs(self.my_bcs)
+
     def tearDown(self):
         super().tearDown()
 
+    def _activate_bcs(self, my_bcs, n_configs=None):
+        """
+        Set the active board-channel connections of the faux group to
+        **my_bcs**, a list of :code:`(brd, chs)` tuples.  If
+        **n_configs** is given, the number of configurations is also
+        updated.
+        """
+        if n_configs is not None:
+            self.mod.knobs.n_configs = n_configs
+
+        # flatten `my_bcs` into (board, channel) index arrays
+        brd_idx = np.repeat([brd for brd, _ in my_bcs],
+                            [len(chs) for _, chs in my_bcs])
+        ch_idx = np.concatenate([chs for _, chs in my_bcs])
+
+        bc_arr = self.mod.knobs.active_brdch
+        bc_arr[...] = False
+        bc_arr[brd_idx, ch_idx] = True
+        self.mod.knobs.active_brdch = bc_arr
+
+    def _setup_map_warnings(self):
+        """
+        Setup faux group for the `test_map_warnings_*` tests.  Returns
+        the tuple `(config_name, adc, config_path, my_bcs)`.
+        """
+        config_name = 'config01'
+        adc = 'SIS 3301'
+        config_path = 'Configuration: {}'.format(config_name)
+        my_bcs = self.my_bcs
+        self.mod.knobs.n_configs = 2
+
+        return config_name, adc, config_path, my_bcs
+
+
+class TestSIS3301(SIS3301TestCase):
+    """Test class for HDFMapDigiSIS3301"""
+
     def test_construct_dataset_name(self):
         """Test functionality of method `construct_dataset_name`"""
         # setup
         config_name = 'config01'
         adc = 'SIS 3301'
         # config_path = 'Configuration: {}'.format(config_name)
-        my_bcs = [(0, (0, 3, 5)),
-                  (3, (0, 1, 2, 3)),
-                  (5, (5, 6, 7))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
+        my_bcs = self.my_bcs
         self.mod.knobs.n_configs = 2
-        self.mod.knobs.active_brdch = bc_arr
 
-        # -- Handling of kwarg `config_name`                        ----
-        # not specified, and only ONE active config
+        # map of the group with only `config_name` active
+        _map = self.map
         brd = my_bcs[0][0]
         ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
+
+        # -- Handling of kwarg `config_name`                        ----
+        # not specified, and only ONE active config
+        dset_name = _dset_names(config_name, brd, ch)[0]
         with self.assertWarns(UserWarning):
-            self.assertEqual(self.map.construct_dataset_name(brd, ch),
+            self.assertEqual(_map.construct_dataset_name(brd, ch),
                              dset_name)
 
         # not specified, and MULTIPLE active configs
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
         self.mod.knobs.active_config = (config_name, 'config02')
         self.assertRaises(ValueError,
                           self.map.construct_dataset_name, brd, ch)
         self.mod.knobs.active_config = config_name
 
         # not specified, and NO active configs
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        _map = self.map
         with mock.patch.object(HDFMapDigiSIS3301, 'active_configs',
                                new_callable=mock.PropertyMock) \
                 as mock_aconfig:
@@ -79,48 +219,30 @@ class TestSIS3301(DigitizerTestCase):
             self.assertRaises(ValueError,
                               _map.construct_dataset_name, brd, ch)
 
-        # `config_name` not in configs
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        self.assertRaises(ValueError,
-                          self.map.construct_dataset_name,
-                          brd, ch, config_name='not a config')
-
-        # `config_name` in configs but not active
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        self.assertRaises(ValueError,
-                          self.map.construct_dataset_name,
-                          brd, ch, config_name='config02')
-
-        # -- Handling of kwarg `adc`                                ----
-        # `adc` not 'SIS 3301'
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        self.assertRaises(ValueError,
-                          self.map.construct_dataset_name,
-                          brd, ch, adc='not SIS 3301')
-
-        # -- `board` and `channel` combo not in configs             ----
-        brd = 1
-        ch = 1
+        # -- remaining ValueError cases                             ----
+        # - the board-channel combo (1, 1) is not in configs
         for conn in my_bcs:
-            if brd == conn[0] and ch in conn[1]:
+            if conn[0] == 1 and 1 in conn[1]:
                 self.fail("test setup is incorrect, brd and ch should "
                           "not be in connections")
-        self.assertRaises(ValueError,
-                          self.map.construct_dataset_name, brd, ch)
+        cases = [
+            ('`config_name` not in configs',
+             (brd, ch), {'config_name': 'not a config'}),
+            ('`config_name` in configs but not active',
+             (brd, ch), {'config_name': 'config02'}),
+            ("`adc` not 'SIS 3301'",
+             (brd, ch), {'adc': 'not SIS 3301'}),
+            ('`board` and `channel` combo not in configs',
+             (1, 1), {}),
+        ]
+        for label, args, kwargs in cases:
+            with self.subTest(label):
+                self.assertRaises(ValueError,
+                                  _map.construct_dataset_name,
+                                  *args, **kwargs)
 
         # -- return when `return_info=True`                         ----
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        _map = self.map
-        d_info = {}
-        for conn in _map.configs[config_name][adc]:
-            if brd == conn[0] and ch in conn[1]:
-                d_info = conn[2]
-                break
+        d_info = _conn_index(_map, config_name, adc)[brd][1]
 
         # get dset_name
         val = _map.construct_dataset_name(brd, ch, return_info=True)
@@ -133,21 +255,18 @@ class TestSIS3301(DigitizerTestCase):
 
         # second element is dataset info
         self.assertIsInstance(val[1], dict)
-        keys = ('adc', 'bit', 'clock rate', 'configuration name',
-                'digitizer', 'nshotnum', 'nt',
-                'sample average (hardware)',
-                'shot average (software)')
-        for key in keys:
-            self.assertIn(key, val[1])
-
-            if key == 'adc':
-                self.assertEqual(val[1][key], adc)
-            elif key == 'configuration name':
-                self.assertEqual(val[1][key], config_name)
-            elif key == 'digitizer':
-                self.assertEqual(val[1][key], _map.info['group name'])
-            else:
-                self.assertEqual(val[1][key], d_info[key])
+        expected = {
+            'adc': adc,
+            'configuration name': config_name,
+            'digitizer': _map.info['group name'],
+        }
+        expected.update({
+            key: d_info[key]
+            for key in ('bit', 'clock rate', 'nshotnum', 'nt',
+                        'sample average (hardware)',
+                        'shot average (software)')
+        })
+        self.assertEqual(val[1], expected)
 
     def test_construct_header_dataset_name(self):
         """
@@ -157,21 +276,13 @@ class TestSIS3301(DigitizerTestCase):
         config_name = 'config01'
         # adc = 'SIS 3301'
         # config_path = 'Configuration: {}'.format(config_name)
-        my_bcs = [(0, (0, 3, 5)),
-                  (3, (0, 1, 2, 3)),
-                  (5, (5, 6, 7))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
+        my_bcs = self.my_bcs
         self.mod.knobs.n_configs = 2
-        self.mod.knobs.active_brdch = bc_arr
 
         # `return_info` does NOT return extra info
         brd = my_bcs[0][0]
         ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        hdset_name = dset_name + ' headers'
+        dset_name, hdset_name = _dset_names(config_name, brd, ch)
         _map = self.map
         with mock.patch.object(
                 HDFMapDigiSIS3301, 'construct_dataset_name',
@@ -200,561 +311,60 @@ class TestSIS3301(DigitizerTestCase):
         config_name = 'config01'
         # adc = 'SIS 3301'
         config_path = 'Configuration: {}'.format(config_name)
-        my_bcs = [(0, (0, 3, 5)),
-                  (3, (0, 1, 2, 3)),
-                  (5, (5, 6, 7))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
-        self.mod.knobs.active_brdch = bc_arr
+        my_bcs = self.my_bcs
 
         # -- failures that occur in `_find_adc_connections`         ----
         # attribute 'Board' missing in board config group
-        path = config_path + '/Boards[0]'
-        brd_group = self.dgroup[path]
-        brd = brd_group.attrs['Board']
-        del brd_group.attrs['Board']
-        with self.assertRaises(HDFMappingError):
+        brd_path = config_path + '/Boards[0]'
+        brd_group = self.dgroup[brd_path]
+        with _missing_attr(brd_group, 'Board'), \
+                self.assertRaises(HDFMappingError):
             _map = self.map
-        brd_group.attrs['Board'] = brd
 
         # the same board number is defined multiple times for an active
         # configuration
-        path = config_path + '/Boards[0]'
         path2 = config_path + '/Boards[{}]'.format(len(my_bcs))
-        brd = self.dgroup[path].attrs['Board']
         self.dgroup.create_group(path2)
-        self.dgroup[path2].attrs['Board'] = brd
-        with self.assertRaises(HDFMappingError):
-            _map = self.map
-        del self.dgroup[path2]
+        self.dgroup[path2].attrs['Board'] = brd_group.attrs['Board']
+        try:
+            with self.assertRaises(HDFMappingError):
+                _map = self.map
+        finally:
+            del self.dgroup[path2]
 
         # attribute 'Channel' missing in channel config group
-        brd_path = config_path + '/Boards[0]'
-        ch_path = brd_path + '/Channels[0]'
-        ch_group = self.dgroup[ch_path]
-        ch = ch_group.attrs['Channel']
-        del ch_group.attrs['Channel']
-        with self.assertRaises(HDFMappingError):
+        ch_group = brd_group['Channels[0]']
+        with _missing_attr(ch_group, 'Channel'), \
+                self.assertRaises(HDFMappingError):
             _map = self.map
-        ch_group.attrs['Channel'] = ch
 
         # -- failures that occur in `_build_configs`                ----
         # group had no identifiable configuration group
-        self.dgroup.move(config_path, 'wrong config name')
-        with self.assertRaises(HDFMappingError):
+        with _renamed(self.dgroup, config_path, 'wrong config name'), \
+                self.assertRaises(HDFMappingError):
             _map = self.map
-        self.dgroup.move('wrong config name', config_path)
 
         # none of the configurations are active
-        self.dgroup.move(config_path, 'Configuration: Not used')
-        with self.assertRaises(HDFMappingError):
+        with _renamed(self.dgroup, config_path,
+                      'Configuration: Not used'), \
+                self.assertRaises(HDFMappingError):
             _map = self.map
-        self.dgroup.move('Configuration: Not used', config_path)
 
         # adc connections for active config are NULL
-        brd_config_names = list(self.dgroup[config_path])
-        for name in brd_config_names:
-            path = config_path + '/' + name
-            del self.dgroup[path]
-        with self.assertRaises(HDFMappingError):
-            _map = self.map
-
-    def test_map_warnings(self):
-        """Test scenarios that should cause a UserWarning."""
-        # 1.  a configuration group sub-group does not match naming
-        #     scheme for a board config group
-        # 2.  'Board' attribute for a board config group is not an int
-        #     or np.integer
-        # 3.  'Board' attribute for a board config group is a negative
-        #     integer
-        # 4.  for a none active config, two board groups define the same
-        #     board number
-        # 5.  a board config sub-group does not match the naming scheme
-        #     for a channel group
-        # 6.  'Channel' attribute for a channel config group is not an
-        #     int or np.integer
-        # 7.  'Channel' attribute for a channel config group is a
-        #     negative integer
-        # 8.  two channel config groups define the same channel number
-        # 9.  the list of discovered channel numbers is NULL
-        # 10. config group attribute 'Samples to average' is not
-        #     convertible to int
-        # 11. an expected dataset is missing
-        # 12. all expected datasets for a board are missing
-        # 13. dataset has fields
-        # 14. dataset is not a 2D array
-        # 15. number of dataset time samples not consistent for all
-        #     channels connected to a board
-        # 16. number of dataset shot numbers not consistent for all
-        #     channels connect to a board, but are still consistent
-        #     with their associated header dataset
-        # 17. header dataset missing expected shot number field
-        # 18. shot number field in header dataset does not have
-        #     expected shape and/or dtype
-        # 19. dataset and associated header dataset do not have same
-        #     number of shot numbers
-        # 20. after all the above checks, ensure the connected channels
-        #     are not NULL for the board
-        #
-        # setup group
-        config_name = 'config01'
-        adc = 'SIS 3301'
-        config_path = 'Configuration: {}'.format(config_name)
-        my_bcs = [(0, (0, 3, 5)),
-                  (3, (0, 1, 2, 3)),
-                  (5, (5, 6, 7))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
-        self.mod.knobs.n_configs = 2
-        self.mod.knobs.active_brdch = bc_arr
-
-        # -- warnings that occur in `_find_adc_connections`         ----
-        # configuration group sub-group does not match board group   (1)
-        # name
-        brd_path = config_path + '/Boards[0]'
-        new_path = config_path + '/Not a board'
-        self.dgroup.move(brd_path, new_path)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-        self.dgroup.move(new_path, brd_path)
-
-        # 'Board' attribute for a board config group is not an int   (2)
-        # or np.integer
-        brd_path = config_path + '/Boards[0]'
-        brd_group = self.dgroup[brd_path]
-        brd = brd_group.attrs['Board']
-        brd_group.attrs['Board'] = 'five'
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            self.assertNotIn(
-                'five',
-                [conn[0] for conn in _map.configs[config_name][adc]])
-
-        # 'Board' attribute for a board config group is a negative   (3)
-        # int
-        brd_group.attrs['Board'] = -1
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            self.assertNotIn(
-                -1,
-                [conn[0] for conn in _map.configs[config_name][adc]])
-        brd_group.attrs['Board'] = brd
-
-        # for none active config, two board config groups define     (4)
-        # the same board number
-        path = 'Configuration: config02/Boards[0]'
-        path2 = 'Configuration: config02/Boards[1]'
-        brd = self.dgroup[path2].attrs['Board']
-        self.dgroup[path2].attrs['Board'] = \
-            self.dgroup[path].attrs['Board']
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            self.assertNotIn(
-                brd,
-                [conn[0] for conn in _map.configs['config02'][adc]])
-        self.dgroup[path2].attrs['Board'] = brd
-
-        # a board config group sub-group does not match naming       (5)
-        # scheme for a channel group
-        brd_path = config_path + '/Boards[0]'
-        ch_path = brd_path + '/Channels[0]'
-        new_path = brd_path + '/Not a channel'
-        self.dgroup.move(ch_path, new_path)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-        self.dgroup.move(new_path, ch_path)
-
-        # 'Channel' attribute for a channel config group is not an   (6)
-        # int or np.integer
-        brd_path = config_path + '/Boards[0]'
-        ch_path = brd_path + '/Channels[0]'
-        ch_group = self.dgroup[ch_path]
-        brd = self.dgroup[brd_path].attrs['Board']
-        ch = ch_group.attrs['Channel']
-        ch_group.attrs['Channel'] = 'five'
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn('five', chs)
-
-        # 'Channel' attribute for a channel config group is a        (7)
-        # negative int
-        ch_group.attrs['Channel'] = -1
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(-1, chs)
-        ch_group.attrs['Channel'] = ch
-
-        # two channel config groups define the same channel number   (8)
-        path = brd_path + '/Channels[0]'
-        path2 = brd_path + '/Channels[1]'
-        brd = self.dgroup[brd_path].attrs['Board']
-        ch = self.dgroup[path2].attrs['Channel']
-        self.dgroup[path2].attrs['Channel'] = \
-            self.dgroup[path].attrs['Channel']
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            self.assertNotIn(
-                brd,
-                [conn[0] for conn in _map.configs[config_name][adc]])
-        self.dgroup[path2].attrs['Channel'] = ch
-
-        # the list of discovered channel numbers is NULL             (9)
-        # - this could happen if there are no channel config groups
-        brd_path = config_path + '/Boards[0]'
-        brd = self.dgroup[brd_path].attrs['Board']
-        ch_group_names = list(self.dgroup[brd_path])
-        for name in ch_group_names:
-            old_path = brd_path + '/' + name
-            new_path = old_path + 'Q'
-            self.dgroup.move(old_path, new_path)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            self.assertNotIn(
-                brd,
-                [conn[0] for conn in _map.configs[config_name][adc]])
-        for name in ch_group_names:
-            old_path = brd_path + '/' + name
-            new_path = old_path + 'Q'
-            self.dgroup.move(new_path, old_path)
-
-        # -- warnings that occur in `_adc_info_first_pass`          ----
-        # config group attribute 'Samples to average' is not        (10)
-        # convertible to int
+        # - the faux group is rebuilt in `tearDown`, so no restore
         config_group = self.dgroup[config_path]
-        s2a = config_group.attrs['Samples to average']
-        config_group.attrs['Samples to average'] = \
-            b'Average 9.0 Samples'
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            for conn in _map.configs[config_name][adc]:
-                self.assertIsNone(conn[2]['sample average (hardware)'])
-        config_group.attrs['Samples to average'] = s2a
-
-        # -- warnings that occur in `_adc_info_second_pass`         ----
-        # an expected dataset is missing                            (11)
-        # i.e. the config groups define a board-channel combo that
-        #      does not have an existing dataset
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        new_name = dset_name + 'Q'
-        self.dgroup.move(dset_name, new_name)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(ch, chs)
-        self.dgroup.move(new_name, dset_name)
-
-        # all expected datasets for a given board are missing       (12)
-        brd = my_bcs[0][0]
-        chs = my_bcs[0][1]
-        for ch in chs:
-            dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-            new_name = dset_name + 'Q'
-            self.dgroup.move(dset_name, new_name)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            self.assertNotIn(
-                brd,
-                [conn[0] for conn in _map.configs[config_name][adc]]
-            )
-        for ch in chs:
-            dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-            new_name = dset_name + 'Q'
-            self.dgroup.move(new_name, dset_name)
-
-        # datasets has fields                                       (13)
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        new_name = dset_name + 'Q'
-        self.dgroup.move(dset_name, new_name)
-        data = np.empty(3, dtype=[('f1', np.int16), ('f2', np.int16)])
-        self.dgroup.create_dataset(dset_name, data=data)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(ch, chs)
-        del self.dgroup[dset_name]
-        self.dgroup.move(new_name, dset_name)
-
-        # dataset is not a 2D array                                 (14)
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        new_name = dset_name + 'Q'
-        self.dgroup.move(dset_name, new_name)
-        data = np.empty((3, 100, 3), dtype=np.int16)
-        self.dgroup.create_dataset(dset_name, data=data)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(ch, chs)
-        del self.dgroup[dset_name]
-        self.dgroup.move(new_name, dset_name)
-
-        # number of dataset time samples not consistent for         (15)
-        # all channels connected to board
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        new_name = dset_name + 'Q'
-        self.dgroup.move(dset_name, new_name)
-        dset = self.dgroup[new_name]
-        data = np.empty((dset.shape[0], dset.shape[1] + 1),
-                        dtype=dset.dtype)
-        self.dgroup.create_dataset(dset_name, data=data)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-                    # nt is set to -1
-                    self.assertEqual(conn[2]['nt'], -1)
-
-            # channel still in mapping
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertIn(ch, chs)
-        del self.dgroup[dset_name]
-        self.dgroup.move(new_name, dset_name)
-
-        # number dataset shot numbers not consistent for all        (16)
-        # channels connected to board, but are still consistent
-        # with their associated header dataset
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        hdset_name = dset_name + ' headers'
-        data = self.dgroup[dset_name][...]
-        hdata = self.dgroup[hdset_name][...]
-        data2 = np.append(data, data[-2::, ...], axis=0)
-        hdata2 = np.append(hdata, hdata[-2::, ...], axis=0)
-        self.dgroup.move(dset_name, dset_name + 'Q')
-        self.dgroup.move(hdset_name, hdset_name + 'Q')
-        self.dgroup.create_dataset(dset_name, data=data2)
-        self.dgroup.create_dataset(hdset_name, data=hdata2)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-                    # nshotnum is set to -1
-                    self.assertEqual(conn[2]['nshotnum'], -1)
-
-            # channel still in mapping
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertIn(ch, chs)
-        del self.dgroup[dset_name]
-        del self.dgroup[hdset_name]
-        self.dgroup.move(dset_name + 'Q', dset_name)
-        self.dgroup.move(hdset_name + 'Q', hdset_name)
-
-        # header dataset missing expected shot number field         (17)
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        hdset_name = dset_name + ' headers'
-        hdata = self.dgroup[hdset_name][...]
-        names = list(hdata.dtype.names)
-        names.remove('Shot')
-        hdata2 = hdata[names]
-        self.dgroup.move(hdset_name, hdset_name + 'Q')
-        self.dgroup.create_dataset(hdset_name, data=hdata2)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            # channel not in mapping
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(ch, chs)
-        del self.dgroup[hdset_name]
-        self.dgroup.move(hdset_name + 'Q', hdset_name)
-
-        # shot number field in header dataset does not have         (18)
-        # expected shape and/or dtype
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        hdset_name = dset_name + ' headers'
-        hdata = self.dgroup[hdset_name][...]
-        self.dgroup.move(hdset_name, hdset_name + 'Q')
-
-        # wrong dtype
-        hdata2 = np.empty(hdata.shape, dtype=[('Shot', np.float32)])
-        self.dgroup.create_dataset(hdset_name, data=hdata2)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            # channel not in mapping
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(ch, chs)
-        del self.dgroup[hdset_name]
-
-        # wrong shape
-        hdata2 = np.empty(hdata.shape, dtype=[('Shot', np.uint32, 2)])
-        self.dgroup.create_dataset(hdset_name, data=hdata2)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            # channel not in mapping
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(ch, chs)
-        del self.dgroup[hdset_name]
-        self.dgroup.move(hdset_name + 'Q', hdset_name)
-
-        # dataset and associated header dataset do not have same    (19)
-        # number of shot numbers
-        brd = my_bcs[0][0]
-        ch = my_bcs[0][1][0]
-        dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-        hdset_name = dset_name + ' headers'
-        hdata = self.dgroup[hdset_name][...]
-        hdata2 = np.append(hdata, hdata[-2::, ...], axis=0)
-        self.dgroup.move(hdset_name, hdset_name + 'Q')
-        self.dgroup.create_dataset(hdset_name, data=hdata2)
-        with self.assertWarns(UserWarning):
-            _map = self.map
-
-            chs = None
-            for conn in _map.configs[config_name][adc]:
-                if conn[0] == brd:
-                    chs = conn[1]
-
-            # channel not in mapping
-            if chs is None:
-                self.fail('board missing from connections')
-            else:
-                self.assertNotIn(ch, chs)
-        del self.dgroup[hdset_name]
-        self.dgroup.move(hdset_name + 'Q', hdset_name)
-
-        # after all the above checks, ensure the connected          (20)
-        # channels are not NULL for the board
-        # i.e. this could happen if all the header datasets for a
-        #      given board are missing the shot number field
-        brd = my_bcs[0][0]
-        chs = my_bcs[0][1]
-        for ch in chs:
-            dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-            hdset_name = dset_name + ' headers'
-
-            hdata = self.dgroup[hdset_name][...]
-            names = list(hdata.dtype.names)
-            names.remove('Shot')
-            hdata2 = hdata[names]
-
-            self.dgroup.move(hdset_name, hdset_name + 'Q')
-            self.dgroup.create_dataset(hdset_name, data=hdata2)
-        with self.assertWarns(UserWarning):
+        for name in list(config_group):
+            del config_group[name]
+        with self.assertRaises(HDFMappingError):
             _map = self.map
 
-            self.assertNotIn(
-                brd,
-                [conn[0] for conn in _map.configs[config_name][adc]]
-            )
-        for ch in chs:
-            dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-            hdset_name = dset_name + ' headers'
-            del self.dgroup[hdset_name]
-            self.dgroup.move(hdset_name + 'Q', hdset_name)
-
     def test_mappings(self):
         """Test various digitizer group setups."""
         # -- One Config & One Active Config                         ----
         # setup faux group
         config_name = 'config01'
         adc = 'SIS 3301'
-        my_bcs = [(0, (0, 3, 5)),
-                  (3, (0, 1, 2, 3)),
-                  (5, (5, 6, 7))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
-        self.mod.knobs.active_brdch = bc_arr
+        my_bcs = self.my_bcs
 
         # test
         _map = self.map
@@ -768,15 +378,10 @@ class TestSIS3301(DigitizerTestCase):
         # setup faux group
         config_name = 'config02'
         adc = 'SIS 3301'
-        self.mod.knobs.n_configs = 3
-        self.mod.knobs.active_config = config_name
         my_bcs = [(0, (1, 2, 3)),
                   (3, (0, 1, 2, 3))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
-        self.mod.knobs.active_brdch = bc_arr
+        self._activate_bcs(my_bcs, n_configs=3)
+        self.mod.knobs.active_config = config_name
 
         # test
         _map = self.map
@@ -791,17 +396,12 @@ class TestSIS3301(DigitizerTestCase):
         # setup faux group
         config_names = ('config02', 'config03')
         adc = 'SIS 3301'
-        self.mod.knobs.n_configs = 3
-        self.mod.knobs.active_config = config_names
         my_bcs = [(0, (0, 3, 5)),
                   (3, (0, 1, 2, 3)),
                   (5, (5, 6, 7)),
                   (8, (1,))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
-        self.mod.knobs.active_brdch = bc_arr
+        self._activate_bcs(my_bcs, n_configs=3)
+        self.mod.knobs.active_config = config_names
 
         # test
         _map = self.map
@@ -810,8 +410,9 @@ class TestSIS3301(DigitizerTestCase):
                          sorted(list(config_names)))
         self.assertEqual(sorted(list(_map.configs)),
                          sorted(self.mod.config_names))
+        expected = tuple(my_bcs)
         for config_name in config_names:
-            self.assertConnectionsEqual(_map, tuple(my_bcs),
+            self.assertConnectionsEqual(_map, expected,
                                         adc, config_name)
 
     def test_misc(self):
@@ -831,49 +432,44 @@ class TestSIS3301(DigitizerTestCase):
         config_name = 'config01'
         adc = 'SIS 3301'
         config_path = 'Configuration: {}'.format(config_name)
-        my_bcs = [(0, (0, 3, 5)),
-                  (3, (0, 1, 2, 3)),
-                  (5, (5, 6, 7))]
-        bc_arr = self.mod.knobs.active_brdch
-        bc_arr[...] = False
-        for brd, chns in my_bcs:
-            bc_arr[brd, chns] = True
-        self.mod.knobs.active_brdch = bc_arr
+        my_bcs = self.my_bcs
+        dgroup = self.dgroup
+        config_attrs = dgroup[config_path].attrs
 
         # -- config group attribute `Shots to average`              ----
-        sh2a = self.dgroup[config_path].attrs['Shots to average']
+        sh2a = config_attrs['Shots to average']
 
         # `Shots to average' missing
-        del self.dgroup[config_path].attrs['Shots to average']
+        del config_attrs['Shots to average']
         _map = self.map
         for conn in _map.configs[config_name][adc]:
             self.assertIsNone(conn[2]['shot average (software)'])
 
         # `Shots to average' is 0 or 1
-        self.dgroup[config_path].attrs['Shots to average'] = 1
+        config_attrs['Shots to average'] = 1
         _map = self.map
         for conn in _map.configs[config_name][adc]:
             self.assertIsNone(conn[2]['shot average (software)'])
 
         # `Shots to average' is >1
-        self.dgroup[config_path].attrs['Shots to average'] = 5
+        config_attrs['Shots to average'] = 5
         _map = self.map
         for conn in _map.configs[config_name][adc]:
             self.assertEqual(conn[2]['shot average (software)'], 5)
 
-        self.dgroup[config_path].attrs['Shots to average'] = sh2a
+        config_attrs['Shots to average'] = sh2a
 
         # -- config group attribute `Samples to average`            ----
-        sp2a = self.dgroup[config_path].attrs['Samples to average']
+        sp2a = config_attrs['Samples to average']
 
         # 'Samples to average' is missing
-        del self.dgroup[config_path].attrs['Samples to average']
+        del config_attrs['Samples to average']
         _map = self.map
         for conn in _map.configs[config_name][adc]:
             self.assertIsNone(conn[2]['sample average (hardware)'])
 
         # 'Samples to average' is 'No averaging'
-        self.dgroup[config_path].attrs['Samples to average'] = \
+        config_attrs['Samples to average'] = \
             np.bytes_('No averaging')
         _map = self.map
         for conn in _map.configs[config_name][adc]:
@@ -881,7 +477,7 @@ class TestSIS3301(DigitizerTestCase):
 
         # 'Samples to average' does not match string
         # 'Average {} Samples'
-        self.dgroup[config_path].attrs['Samples to average'] = \
+        config_attrs['Samples to average'] = \
             np.bytes_('hello')
         _map = self.map
         for conn in _map.configs[config_name][adc]:
@@ -889,7 +485,7 @@ class TestSIS3301(DigitizerTestCase):
 
         # 'Samples to average' does match string 'Average {} Samples',
         # but can not be converted to int
-        self.dgroup[config_path].attrs['Samples to average'] = \
+        config_attrs['Samples to average'] = \
             np.bytes_('Average 5.0 Samples')
         _map = None
         with self.assertWarns(UserWarning):
@@ -900,7 +496,7 @@ class TestSIS3301(DigitizerTestCase):
         # 'Samples to average' does match string 'Average {} Samples',
         # and is converted to an int of 0 or 1
         for val in (0, 1):
-            self.dgroup[config_path].attrs['Samples to average'] = \
+            config_attrs['Samples to average'] = \
                 np.bytes_('Average {} Samples'.format(val))
             _map = self.map
             for conn in _map.configs[config_name][adc]:
@@ -908,7 +504,7 @@ class TestSIS3301(DigitizerTestCase):
 
         # 'Samples to average' does match string 'Average {} Samples',
         # and is converted to an int >1
-        self.dgroup[config_path].attrs['Samples to average'] = \
+        config_attrs['Samples to average'] = \
             np.bytes_('Average 5 Samples'.format(val))
         _map = self.map
         for conn in _map.configs[config_name][adc]:
@@ -916,8 +512,8 @@ class TestSIS3301(DigitizerTestCase):
 
         # 'Samples to average' is named 'Unnamed' instead, and valid
         # (as seen on some SmPD HDF5 files)
-        del self.dgroup[config_path].attrs['Samples to average']
-        self.dgroup[config_path].attrs['Unnamed'] = \
+        del config_attrs['Samples to average']
+        config_attrs['Unnamed'] = \
             np.bytes_('Average 2 Samples'.format(val))
         _map = self.map
         for conn in _map.configs[config_name][adc]:
@@ -925,26 +521,25 @@ class TestSIS3301(DigitizerTestCase):
 
         # 'Samples to average' is named 'Unnamed' instead, and is NOT a
         # byte string (as seen on some SmPD HDF5 files)
-        self.dgroup[config_path].attrs['Unnamed'] = 5
+        config_attrs['Unnamed'] = 5
         _map = self.map
         for conn in _map.configs[config_name][adc]:
             self.assertIsNone(conn[2]['sample average (hardware)'])
-        del self.dgroup[config_path].attrs['Unnamed']
+        del config_attrs['Unnamed']
 
         # restore original value
-        self.dgroup[config_path].attrs['Samples to average'] = sp2a
+        config_attrs['Samples to average'] = sp2a
 
         # -- header dataset with 'Shot number' field                ----
         # rename field for all board-channel connections
         for conn in my_bcs:
             brd = conn[0]
             for ch in conn[1]:
-                dset_name = "{0} [{1}:{2}]".format(config_name, brd, ch)
-                hdset_name = dset_name + ' headers'
-                hdset = self.dgroup[hdset_name][...]
+                dset_name, hdset_name = _dset_names(config_name, brd, ch)
+                hdset = dgroup[hdset_name][...]
                 hdset = rfn.rename_fields(hdset, {'Shot': 'Shot number'})
-                del self.dgroup[hdset_name]
-                self.dgroup.create_dataset(hdset_name, data=hdset)
+                del dgroup[hdset_name]
+                dgroup.create_dataset(hdset_name, data=hdset)
 
         _map = self.map
         self.assertEqual(
@@ -963,5 +558,364 @@ class TestSIS3301(DigitizerTestCase):
         self.assertIsNone(_map._parse_config_name('Not a config'))
 
 
+# Scenarios that should cause a UserWarning are split across the
+# `TestSIS3301Warnings*` classes by the mapping stage that issues the
+# warning, so each class can be run (and distributed) independently
+# and a failing scenario does not mask the others.
+#
+# 1.  a configuration group sub-group does not match naming
+#     scheme for a board config group
+# 2.  'Board' attribute for a board config group is not an int
+#     or np.integer
+# 3.  'Board' attribute for a board config group is a negative
+#     integer
+# 4.  for a none active config, two board groups define the same
+#     board number
+# 5.  a board config sub-group does not match the naming scheme
+#     for a channel group
+# 6.  'Channel' attribute for a channel config group is not an
+#     int or np.integer
+# 7.  'Channel' attribute for a channel config group is a
+#     negative integer
+# 8.  two channel config groups define the same channel number
+# 9.  the list of discovered channel numbers is NULL
+# 10. config group attribute 'Samples to average' is not
+#     convertible to int
+# 11. an expected dataset is missing
+# 12. all expected datasets for a board are missing
+# 13. dataset has fields
+# 14. dataset is not a 2D array
+# 15. number of dataset time samples not consistent for all
+#     channels connected to a board
+# 16. number of dataset shot numbers not consistent for all
+#     channels connect to a board, but are still consistent
+#     with their associated header dataset
+# 17. header dataset missing expected shot number field
+# 18. shot number field in header dataset does not have
+#     expected shape and/or dtype
+# 19. dataset and associated header dataset do not have same
+#     number of shot numbers
+# 20. after all the above checks, ensure the connected channels
+#     are not NULL for the board
+#
+class TestSIS3301WarningsFindAdc(SIS3301TestCase):
+    """Test HDFMapDigiSIS3301 warnings in `_find_adc_connections`"""
+
+    def test_map_warnings_find_adc_connections(self):
+        """
+        Test scenarios that should cause a UserWarning in
+        `_find_adc_connections`. (scenarios 1-9)
+        """
+        config_name, adc, config_path, my_bcs = \
+            self._setup_map_warnings()
+
+        # -- warnings that occur in `_find_adc_connections`         ----
+        # configuration group sub-group does not match board group   (1)
+        # name
+        with self.subTest(scenario=1):
+            brd_path = config_path + '/Boards[0]'
+            new_path = config_path + '/Not a board'
+            # warning-only scenario, the mapping is not inspected
+            with _renamed(self.dgroup, brd_path, new_path), \
+                    self.assertWarns(UserWarning):
+                self.map_device(self.dgroup)
+
+        # 'Board' attribute for a board config group is not an int   (2)
+        # or np.integer
+        brd_path = config_path + '/Boards[0]'
+        brd_group = self.dgroup[brd_path]
+        with self.subTest(scenario=2), \
+                swap_attr(brd_group, 'Board', 'five'), \
+                self.assertWarns(UserWarning):
+            _map = self.map
+
+            self.assertNotIn(
+                'five', _conn_index(_map, config_name, adc))
+
+        # 'Board' attribute for a board config group is a negative   (3)
+        # int
+        with self.subTest(scenario=3), \
+                swap_attr(brd_group, 'Board', -1), \
+                self.assertWarns(UserWarning):
+            _map = self.map
+
+            self.assertNotIn(
+                -1, _conn_index(_map, config_name, adc))
+
+        # for none active config, two board config groups define     (4)
+        # the same board number
+        with self.subTest(scenario=4):
+            path = 'Configuration: config02/Boards[0]'
+            path2 = 'Configuration: config02/Boards[1]'
+            brd_group2 = self.dgroup[path2]
+            dup_brd = self.dgroup[path].attrs['Board']
+            with swap_attr(brd_group2, 'Board', dup_brd) as brd, \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                self.assertNotIn(
+                    brd, _conn_index(_map, 'config02', adc))
+
+        # a board config group sub-group does not match naming       (5)
+        # scheme for a channel group
+        with self.subTest(scenario=5):
+            brd_path = config_path + '/Boards[0]'
+            ch_path = brd_path + '/Channels[0]'
+            new_path = brd_path + '/Not a channel'
+            # warning-only scenario, the mapping is not inspected
+            with _renamed(self.dgroup, ch_path, new_path), \
+                    self.assertWarns(UserWarning):
+                self.map_device(self.dgroup)
+
+        # 'Channel' attribute for a channel config group is not an   (6)
+        # int or np.integer
+        ch_group = brd_group['Channels[0]']
+        brd = brd_group.attrs['Board']
+        with self.subTest(scenario=6), \
+                swap_attr(ch_group, 'Channel', 'five'), \
+                self.assertWarns(UserWarning):
+            _map = self.map
+
+            conns = _conn_index(_map, config_name, adc)
+            if brd not in conns:
+                self.fail('board missing from connections')
+            self.assertNotIn('five', conns[brd][0])
+
+        # 'Channel' attribute for a channel config group is a        (7)
+        # negative int
+        with self.subTest(scenario=7), \
+                swap_attr(ch_group, 'Channel', -1), \
+                self.assertWarns(UserWarning):
+            _map = self.map
+
+            conns = _conn_index(_map, config_name, adc)
+            if brd not in conns:
+                self.fail('board missing from connections')
+            self.assertNotIn(-1, conns[brd][0])
+
+        # two channel config groups define the same channel number   (8)
+        with self.subTest(scenario=8):
+            dup_ch = ch_group.attrs['Channel']
+            with swap_attr(brd_group['Channels[1]'], 'Channel', dup_ch), \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                self.assertNotIn(
+                    brd, _conn_index(_map, config_name, adc))
+
+        # the list of discovered channel numbers is NULL             (9)
+        # - this could happen if there are no channel config groups
+        with self.subTest(scenario=9), ExitStack() as stack:
+            for name in list(brd_group):
+                stack.enter_context(
+                    _renamed(brd_group, name, name + 'Q'))
+            with self.assertWarns(UserWarning):
+                _map = self.map
+
+                self.assertNotIn(
+                    brd, _conn_index(_map, config_name, adc))
+
+
+class TestSIS3301WarningsAdcInfoFirst(SIS3301TestCase):
+    """Test HDFMapDigiSIS3301 warnings in `_adc_info_first_pass`"""
+
+    def test_map_warnings_adc_info_first_pass(self):
+        """
+        Test scenarios that should cause a UserWarning in
+        `_adc_info_first_pass`. (scenario 10)
+        """
+        config_name, adc, config_path, my_bcs = \
+            self._setup_map_warnings()
+
+        # -- warnings that occur in `_adc_info_first_pass`          ----
+        # config group attribute 'Samples to average' is not        (10)
+        # convertible to int
+        config_group = self.dgroup[config_path]
+        with self.subTest(scenario=10), \
+                swap_attr(config_group, 'Samples to average',
+                          b'Average 9.0 Samples'), \
+                self.assertWarns(UserWarning):
+            _map = self.map
+
+            for conn in _map.configs[config_name][adc]:
+                self.assertIsNone(conn[2]['sample average (hardware)'])
+
+
+class TestSIS3301WarningsAdcInfoSecond(SIS3301TestCase):
+    """Test HDFMapDigiSIS3301 warnings in `_adc_info_second_pass`"""
+
+    def test_map_warnings_adc_info_second_pass(self):
+        """
+        Test scenarios that should cause a UserWarning in
+        `_adc_info_second_pass`. (scenarios 11-20)
+        """
+        config_name, adc, config_path, my_bcs = \
+            self._setup_map_warnings()
+        brd = my_bcs[0][0]
+        chs = my_bcs[0][1]
+        ch = chs[0]
+        dset_name, hdset_name = _dset_names(config_name, brd, ch)
+
+        # -- warnings that occur in `_adc_info_second_pass`         ----
+        # an expected dataset is missing                            (11)
+        # i.e. the config groups define a board-channel combo that
+        #      does not have an existing dataset
+        with self.subTest(scenario=11), \
+                _renamed(self.dgroup, dset_name, dset_name + 'Q'), \
+                self.assertWarns(UserWarning):
+            _map = self.map
+
+            conns = _conn_index(_map, config_name, adc)
+            if brd not in conns:
+                self.fail('board missing from connections')
+            self.assertNotIn(ch, conns[brd][0])
+
+        # all expected datasets for a given board are missing       (12)
+        with self.subTest(scenario=12), ExitStack() as stack:
+            for _ch in chs:
+                name = _dset_names(config_name, brd, _ch)[0]
+                stack.enter_context(
+                    _renamed(self.dgroup, name, name + 'Q'))
+            with self.assertWarns(UserWarning):
+                _map = self.map
+
+                self.assertNotIn(
+                    brd, _conn_index(_map, config_name, adc))
+
+        # datasets has fields                                       (13)
+        with self.subTest(scenario=13):
+            data = np.empty(3, dtype=_DT_TWO_I16)
+            with replaced_dataset(self.dgroup, dset_name, data), \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                conns = _conn_index(_map, config_name, adc)
+                if brd not in conns:
+                    self.fail('board missing from connections')
+                self.assertNotIn(ch, conns[brd][0])
+
+        # dataset is not a 2D array                                 (14)
+        with self.subTest(scenario=14):
+            data = np.empty((3, 100, 3), dtype=np.int16)
+            with replaced_dataset(self.dgroup, dset_name, data), \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                conns = _conn_index(_map, config_name, adc)
+                if brd not in conns:
+                    self.fail('board missing from connections')
+                self.assertNotIn(ch, conns[brd][0])
+
+        # number of dataset time samples not consistent for         (15)
+        # all channels connected to board
+        with self.subTest(scenario=15):
+            dset = self.dgroup[dset_name]
+            data = np.empty((dset.shape[0], dset.shape[1] + 1),
+                            dtype=dset.dtype)
+            with replaced_dataset(self.dgroup, dset_name, data), \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                conns = _conn_index(_map, config_name, adc)
+                # channel still in mapping
+                if brd not in conns:
+                    self.fail('board missing from connections')
+                self.assertIn(ch, conns[brd][0])
+
+                # nt is set to -1
+                self.assertEqual(conns[brd][1]['nt'], -1)
+
+        # number dataset shot numbers not consistent for all        (16)
+        # channels connected to board, but are still consistent
+        # with their associated header dataset
+        with self.subTest(scenario=16):
+            data = self.dgroup[dset_name][...]
+            hdata = self.dgroup[hdset_name][...]
+            data2 = _repeat_last_rows(data, 2)
+            hdata2 = _repeat_last_rows(hdata, 2)
+            with replaced_dataset(self.dgroup, dset_name, data2), \
+                    replaced_dataset(self.dgroup, hdset_name, hdata2), \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                conns = _conn_index(_map, config_name, adc)
+                # channel still in mapping
+                if brd not in conns:
+                    self.fail('board missing from connections')
+                self.assertIn(ch, conns[brd][0])
+
+                # nshotnum is set to -1
+                self.assertEqual(conns[brd][1]['nshotnum'], -1)
+
+        # header dataset missing expected shot number field         (17)
+        with self.subTest(scenario=17):
+            hdata = self.dgroup[hdset_name][...]
+            names = list(hdata.dtype.names)
+            names.remove('Shot')
+            hdata2 = hdata[names]
+            with replaced_dataset(self.dgroup, hdset_name, hdata2), \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                conns = _conn_index(_map, config_name, adc)
+                # channel not in mapping
+                if brd not in conns:
+                    self.fail('board missing from connections')
+                self.assertNotIn(ch, conns[brd][0])
+
+        # shot number field in header dataset does not have         (18)
+        # expected shape and/or dtype
+        hshape = self.dgroup[hdset_name].shape
+        for hdtype in (_DT_SHOT_F32,        # wrong dtype
+                       _DT_SHOT_U32_2):     # wrong shape
+            with self.subTest(scenario=18, hdtype=hdtype):
+                hdata2 = np.empty(hshape, dtype=hdtype)
+                with replaced_dataset(self.dgroup, hdset_name, hdata2), \
+                        self.assertWarns(UserWarning):
+                    _map = self.map
+
+                    conns = _conn_index(_map, config_name, adc)
+                    # channel not in mapping
+                    if brd not in conns:
+                        self.fail('board missing from connections')
+                    self.assertNotIn(ch, conns[brd][0])
+
+        # dataset and associated header dataset do not have same    (19)
+        # number of shot numbers
+        with self.subTest(scenario=19):
+            hdata = self.dgroup[hdset_name][...]
+            hdata2 = _repeat_last_rows(hdata, 2)
+            with replaced_dataset(self.dgroup, hdset_name, hdata2), \
+                    self.assertWarns(UserWarning):
+                _map = self.map
+
+                conns = _conn_index(_map, config_name, adc)
+                # channel not in mapping
+                if brd not in conns:
+                    self.fail('board missing from connections')
+                self.assertNotIn(ch, conns[brd][0])
+
+        # after all the above checks, ensure the connected          (20)
+        # channels are not NULL for the board
+        # i.e. this could happen if all the header datasets for a
+        #      given board are missing the shot number field
+        with self.subTest(scenario=20), ExitStack() as stack:
+            for _ch in chs:
+                _hdset_name = _dset_names(config_name, brd, _ch)[1]
+
+                hdata = self.dgroup[_hdset_name][...]
+                names = list(hdata.dtype.names)
+                names.remove('Shot')
+                hdata2 = hdata[names]
+
+                stack.enter_context(
+                    replaced_dataset(self.dgroup, _hdset_name, hdata2))
+            with self.assertWarns(UserWarning):
+                _map = self.map
+
+                self.assertNotIn(
+                    brd, _conn_index(_map, config_name, adc))
+
+
 if __name__ == '__main__':
     ut.main()
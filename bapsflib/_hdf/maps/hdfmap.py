@@ -11,6 +11,7 @@
 import h5py
 import numpy as np
 import os
+import posixpath
 
 from typing import (List, Union)
 from warnings import warn
@@ -162,12 +163,16 @@ class HDFMap(object):
                 devices_known[path].extend(mapped)
             else:
                 devices_known[path] = mapped.copy()
+        # - the group is opened once per path and unknown items are
+        #   named from the group path, so no item is opened
         for path, devices in devices_known.items():
             if path in self._hdf_obj:
-                for item in self._hdf_obj[path]:
+                group = self._hdf_obj[path]
+                devices = set(devices)
+                for item in group:
                     if item not in devices:
                         self.__unknowns.append(
-                            self._hdf_obj[path][item].name)
+                            posixpath.join(group.name, item))
 
     @property
     def controls(self) -> Union[dict, HDFMapControls]:
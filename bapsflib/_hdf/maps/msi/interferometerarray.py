@@ -343,21 +343,21 @@ class HDFMapMSIInterferometerArray(HDFMapMSITemplate):
         sn_shapes = self._configs['shotnum']['shape']
         self._configs['shotnum']['shape'] = sn_shapes[0]
 
+        # define shape of signal fields
+        if check_n_inter:
+            # 'n interferometer' was found in the HDF5 file
+            shape = (int(self._configs['n interferometer'][0]),
+                     sig_size)
+        else:
+            # 'n interferometer' was NOT found, rely on count
+            shape = (n_inter_count, sig_size)
+
         # check 'signals' and 'meta'
         # 1. convert 'dset paths' from list to tuple
         # 2. every dataset has the same 'shape'
         for subfield in ('signals', 'meta'):
             subconfigs = self._configs[subfield]
             for field, config in subconfigs.items():
-                # define shape
-                if check_n_inter:
-                    # 'n interferometer' was found in the HDF5 file
-                    shape = (int(self._configs['n interferometer'][0]),
-                             sig_size)
-                else:
-                    # 'n interferometer' was NOT found, rely on count
-                    shape = (n_inter_count, sig_size)
-
                 # update ['meta']['shape']
                 if field == 'shape' and subfield == 'meta':
                     self._configs[subfield][field] = (shape[0],)
@@ -371,10 +371,10 @@ class HDFMapMSIInterferometerArray(HDFMapMSITemplate):
                 if subfield == 'signals':
                     self._configs[subfield][field]['shape'] = shape
                 else:
-                    shapes = self._configs[subfield][field]['shape']
-                    if all(shape == shapes[0] for shape in shapes):
+                    shapes = set(config['shape'])
+                    if len(shapes) == 1:
                         self._configs[subfield][field]['shape'] = \
-                            shapes[0]
+                            shapes.pop()
                     else:
                         why = ("dataset shape for field '" + field
                                + "' is not consistent for all "
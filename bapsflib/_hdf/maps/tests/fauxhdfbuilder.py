@@ -65,7 +65,10 @@ class FauxHDFBuilder(h5py.File):
         """
         :param str name: name of HDF5 file
         :param add_modules:
-        :param kwargs:
+        :param kwargs: additional keywords passed on to
+            :class:`h5py.File` (e.g. :code:`driver='core'`).
+            :code:`libver` defaults to :code:`'latest'` so groups with
+            many attributes use dense attribute storage.
         """
         # define file name, directory, and path
         if name is None:
@@ -97,7 +100,8 @@ class FauxHDFBuilder(h5py.File):
             self._path = os.path.abspath(name)
 
         # initialize
-        h5py.File.__init__(self, self.path, 'w')
+        kwargs.setdefault('libver', 'latest')
+        h5py.File.__init__(self, self.path, 'w', **kwargs)
 
         # create root groups
         self.create_group('MSI')
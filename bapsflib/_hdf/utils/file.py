@@ -24,6 +24,11 @@ class File(h5py.File):
     All functionality of :class:`h5py.File` is preserved (for details
     see http://docs.h5py.org/en/latest/)
     """
+    #: Default size (in bytes) of the raw data chunk cache for each
+    #: dataset, used when :code:`rdcc_nbytes` is not given.  (Only
+    #: applied for :mod:`h5py` >= 2.9)
+    DEFAULT_RDCC_NBYTES = 16 * 1024 ** 2
+
     def __init__(self, name: str, mode='r',
                  control_path='/', digitizer_path='/', msi_path='/',
                  silent=False, **kwargs):
@@ -40,7 +45,9 @@ class File(h5py.File):
         :param silent: set :code:`True` to suppress warnings
             (:code:`False` DEFAULT)
         :param kwargs:  additional keywords passed on to
-            :class:`h5py.File`
+            :class:`h5py.File` (the chunk cache size
+            :code:`rdcc_nbytes` defaults to
+            :attr:`DEFAULT_RDCC_NBYTES`)
 
         :Example:
 
@@ -58,6 +65,13 @@ class File(h5py.File):
                 "Only `mode` readonly 'r' and read/write 'r+' are "
                 "supported.")
         kwargs['mode'] = mode
+
+        # enlarge the default chunk cache (1 MiB) so reading whole
+        # datasets (e.g. digitizer or MSI signals) does not re-read
+        # and re-decompress chunks
+        if h5py.version.version_tuple[:2] >= (2, 9):
+            kwargs.setdefault('rdcc_nbytes', self.DEFAULT_RDCC_NBYTES)
+
         h5py.File.__init__(self, name, **kwargs)
 
         # -- define device paths --
@@ -97,6 +111,54 @@ class File(h5py.File):
             control_path=self.CONTROL_PATH,
             digitizer_path=self.DIGITIZER_PATH,
             msi_path=self.MSI_PATH)
+        self._reset_map_caches()
+
+    def _reset_map_caches(self):
+        """
+        Reset all caches derived from :attr:`file_map`.  Needs to be
+        called whenever the file is (re-)mapped.
+        """
+        # last shot number of datasets in read-only files
+        # (see :func:`~.helpers.condition_shotnum`)
+        self._last_shotnum_cache = {}
+
+        # lookup table of control device configurations and contypes
+        # (see :attr:`_controls_lookup`)
+        self._controls_lookup_cache = None
+
+        # dtype and read plan of each MSI diagnostic
+        # (see :class:`~.hdfreadmsi.HDFReadMSI`)
+        self._msi_read_plans = {}
+
+        # digitizer dataset names and info for explicitly given
+        # (digitizer, board, channel, config_name, adc)
+        # (see :class:`~.hdfreaddata.HDFReadData`)
+        self._digi_dset_names = {}
+
+    @property
+    def _controls_lookup(self) -> Dict[str, Tuple[frozenset, Any, Any]]:
+        """
+        Lookup table used by :func:`~.helpers.condition_controls`.  For
+        each control device name the tuple
+        :code:`(config_names, default_config, contype)` is given, where
+        :code:`default_config` is the configuration name if the device
+        has only ONE configuration, otherwise :code:`None`.
+
+        The table is built from :attr:`file_map` on first access and is
+        reset by :meth:`_map_file`.  Changes made to the control maps
+        after the first access are not seen until the file is
+        re-mapped.
+        """
+        if self._controls_lookup_cache is None:
+            lookup = {}
+            for name, cmap in self.file_map.controls.items():
+                configs = frozenset(cmap.configs)
+                default_config = next(iter(configs)) \
+                    if len(configs) == 1 else None
+                lookup[name] = (configs, default_config, cmap.contype)
+            self._controls_lookup_cache = lookup
+
+        return self._controls_lookup_cache
 
     @property
     def controls(self) -> HDFMapControls:
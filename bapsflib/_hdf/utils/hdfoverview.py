@@ -8,6 +8,7 @@
 # License: Standard 3-clause BSD; see "LICENSES/LICENSE.txt" for full
 #   license terms and contributor agreement.
 #
+import io
 import os
 import platform
 import pprint as pp
@@ -59,13 +60,28 @@ class HDFOverview(object):
         print('=' * 72 + '\n\n')
 
         # ------ Print General Info                               ------
-        self.report_general()
+        self._print_section(self.report_general)
 
         # ------ Print Discovery Report                           ------
-        self.report_discovery()
+        self._print_section(self.report_discovery)
 
         # ------ Print Detailed Reports                           ------
-        self.report_details()
+        self._print_section(self.report_details)
+
+    @staticmethod
+    def _print_section(report_section):
+        """
+        Runs the report method **report_section** with its output
+        collected in a buffer, then prints the buffer with one write
+        (instead of a separate write for every printed line).  The
+        buffered output is still printed if **report_section** raises.
+        """
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                report_section()
+        finally:
+            print(buffer.getvalue(), end='')
 
     def save(self, filename=''):
         """
@@ -321,6 +337,17 @@ class HDFOverview(object):
                 nconf_active, nconfigs - nconf_active)
             status_print(item, '', note, indent=1)
 
+            # adc header line (same for every adc)
+            line_indent = ('|   ' * 4) + '+-- '
+            header = line_indent + '(brd, [ch, ...])'
+            header = header.ljust(51)
+            header += 'bit'.ljust(5)
+            header += 'clock rate'.ljust(13)
+            header += 'nshotnum'.ljust(10)
+            header += 'nt'.ljust(10)
+            header += 'shot ave.'.ljust(11)
+            header += 'sample ave.'
+
             for cname, config in digi.configs.items():
                 # print configuration name
                 item = cname
@@ -329,7 +356,8 @@ class HDFOverview(object):
                 status_print(item, found, note, indent=2)
 
                 # print active adc's
-                item = "adc's (active):  {}".format(config['adc'])
+                adcs = config['adc']
+                item = "adc's (active):  {}".format(adcs)
                 status_print(item, '', '', indent=3)
 
                 # print path for config
@@ -337,28 +365,18 @@ class HDFOverview(object):
                 status_print(item, '', '', indent=3)
 
                 # print adc details for configuration
-                for adc in config['adc']:
+                for adc in adcs:
                     # adc name
                     item = adc + ' adc connections'
                     status_print(item, '', '', indent=3)
 
                     # print adc header
-                    line_indent = ('|   ' * 4) + '+-- '
-                    line = line_indent + '(brd, [ch, ...])'
-                    line = line.ljust(51)
-                    line += 'bit'.ljust(5)
-                    line += 'clock rate'.ljust(13)
-                    line += 'nshotnum'.ljust(10)
-                    line += 'nt'.ljust(10)
-                    line += 'shot ave.'.ljust(11)
-                    line += 'sample ave.'
-                    print(line)
+                    print(header)
 
                     # adc connections
-                    nconns = len(config[adc])
-                    for iconn in range(nconns):
-                        conns = config[adc][iconn][0:2]
-                        adc_stats = config[adc][iconn][2]
+                    for conn in config[adc]:
+                        conns = conn[0:2]
+                        adc_stats = conn[2]
 
                         # construct and print line
                         line = line_indent + str(conns)
@@ -446,6 +464,11 @@ class HDFOverview(object):
             status_print(item, '', '', indent=1)
 
 
+#: column 1 prefixes for :func:`status_print`, indexed by indent level
+_INDENT_PREFIX = ('', '+-- ') + tuple(
+    ('|   ' * (indent - 1)) + '+-- ' for indent in range(2, 8))
+
+
 def status_print(first: str, second: str, third: str,
                  indent=0, onetwo_pad=' ', second_tab=55):
     """
@@ -472,14 +495,12 @@ def status_print(first: str, second: str, third: str,
     """
     note_tab = 7
 
-    if indent == 0:
-        str_print = ''
-    elif indent == 1:
-        str_print = '+-- '
+    if 0 <= indent < len(_INDENT_PREFIX):
+        prefix = _INDENT_PREFIX[indent]
     else:
-        str_print = ('|   ' * (indent - 1)) + '+-- '
-    str_print += str(first) + ' '
-    str_print = str_print.ljust(second_tab - 1, onetwo_pad) + ' '
-    str_print += str(second).ljust(note_tab) + str(third)
+        prefix = ('|   ' * (indent - 1)) + '+-- '
+    str_print = '{}{} '.format(prefix, first)
+    str_print = str_print.ljust(second_tab - 1, onetwo_pad)
 
-    print(str_print)
+    print('{} {}{}'.format(str_print, str(second).ljust(note_tab),
+                           third))
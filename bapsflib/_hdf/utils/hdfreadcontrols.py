@@ -11,7 +11,6 @@
 import copy
 import h5py
 import numpy as np
-import os
 import time
 
 from bapsflib._hdf.maps.controls.templates import \
@@ -238,7 +237,7 @@ class HDFReadControls(np.ndarray):
         # perform `shotnum` conditioning
         # - `shotnum` is returned as a numpy array
         shotnum = condition_shotnum(shotnum, cdset_dict,
-                                    shotnumkey_dict)
+                                    shotnumkey_dict, hdf_file=hdf_file)
 
         # ---- Build `index` and `sni` arrays for each dataset      ----
         #
@@ -489,7 +488,7 @@ class HDFReadControls(np.ndarray):
         # -- Populate `_info`                                      ----
         # initialize `_info`
         obj._info = {
-            'source file': os.path.abspath(hdf_file.filename),
+            'source file': hdf_file.info['absolute file path'],
             'controls': {},
             'probe name': None,
             'port': (None, None),
@@ -11,12 +11,12 @@
 #
 import astropy.units as u
 import copy
+import h5py
 import numpy as np
-import os
 import time
 
 from bapsflib.plasma import core
-from typing import Union
+from typing import (List, Union)
 from warnings import warn
 
 from .file import File
@@ -25,6 +25,76 @@ from .helpers import (build_sndr_for_simple_dset, condition_controls,
 from .hdfreadcontrols import HDFReadControls
 
 
+def _index_selection(index: np.ndarray) -> Union[slice, list]:
+    """
+    Convert an array of sorted, unique dataset row indices into a
+    selection for an :class:`h5py.Dataset`.  If the indices are evenly
+    spaced a :class:`slice` is returned, which HDF5 reads as a single
+    hyperslab, otherwise the indices are returned as a :class:`list`
+    (i.e. a point selection).
+
+    :param index: sorted array of unique row indices
+    """
+    if index.size == 1:
+        return slice(int(index[0]), int(index[0]) + 1)
+    elif index.size > 1:
+        steps = np.diff(index)
+        if steps[0] > 0 and np.all(steps == steps[0]):
+            return slice(int(index[0]), int(index[-1]) + 1,
+                         int(steps[0]))
+
+    return index.tolist()
+
+
+def _index_runs(index: np.ndarray) -> List[slice]:
+    """
+    Split an array of sorted, unique dataset row indices into runs of
+    consecutive indices.  Each run is returned as a :class:`slice`.
+
+    :param index: sorted array of unique row indices
+    """
+    if index.size == 0:
+        return []
+
+    # positions in `index` where a new run begins
+    splits = np.flatnonzero(np.diff(index) != 1) + 1
+    starts = index[np.concatenate(([0], splits))]
+    stops = index[np.concatenate((splits - 1, [index.size - 1]))] + 1
+
+    return [slice(int(start), int(stop))
+            for start, stop in zip(starts, stops)]
+
+
+def _read_rows(dset: h5py.Dataset, index: np.ndarray) -> np.ndarray:
+    """
+    Read rows `index` of the 2D dataset `dset`.  Evenly spaced
+    indices are read as one hyperslab (see :func:`_index_selection`).
+    Otherwise, each run of consecutive indices is read as its own
+    hyperslab into a single array, unless the runs average less than
+    2 rows, in which case the indices are read as one point selection.
+
+    :param dset: dataset to read from
+    :param index: sorted array of unique row indices
+    """
+    sel = _index_selection(index)
+    if isinstance(sel, slice):
+        return dset[sel, ...]
+
+    runs = _index_runs(index)
+    if 2 * len(runs) > index.size:
+        return dset[sel, ...]
+
+    data = np.empty((index.size,) + dset.shape[1:], dtype=dset.dtype)
+    start = 0
+    for run in runs:
+        stop = start + run.stop - run.start
+        dset.read_direct(data, np.s_[run, ...],
+                         np.s_[start:stop, ...])
+        start = stop
+
+    return data
+
+
 # noinspection PyInitNewSignature
 class HDFReadData(np.ndarray):
     """
@@ -237,10 +307,20 @@ class HDFReadData(np.ndarray):
             kwargs['adc'] = adc
 
         # Get datasets
-        dname, d_info = _dmap.construct_dataset_name(
-            board, channel, **kwargs)
-        dhname = _dmap.construct_header_dataset_name(
-            board, channel, **kwargs)
+        # - names are cached on the file object when `config_name`
+        #   and `adc` are given, otherwise the digitizer map has to
+        #   (re-)issue its warnings about assumed arguments
+        dkey = (_dmap.device_name, board, channel, config_name, adc)
+        try:
+            dname, d_info, dhname = hdf_file._digi_dset_names[dkey]
+        except KeyError:
+            dname, d_info = _dmap.construct_dataset_name(
+                board, channel, **kwargs)
+            dhname = _dmap.construct_header_dataset_name(
+                board, channel, **kwargs)
+            if config_name is not None and adc is not None:
+                hdf_file._digi_dset_names[dkey] = (dname, d_info,
+                                                   dhname)
         dpath = _dmap.info['group path'] + '/'
         dset = hdf_file.get(dpath + dname)
         dheader = hdf_file.get(dpath + dhname)
@@ -353,7 +433,7 @@ class HDFReadData(np.ndarray):
             index = np.unique(index)
 
             # define `shotnum`
-            shotnum = dheader[index.tolist(), shotnumkey]
+            shotnum = dheader[_index_selection(index), shotnumkey]
 
             # define sni
             sni = np.ones(shotnum.shape[0], dtype=np.bool)
@@ -414,7 +494,8 @@ class HDFReadData(np.ndarray):
             # - `shotnum` is returned as a numpy array
             shotnum = condition_shotnum(shotnum,
                                         {'digi': dheader},
-                                        {'digi': shotnumkey})
+                                        {'digi': shotnumkey},
+                                        hdf_file=hdf_file)
 
             # Calc. the corresponding `index` and `sni`
             # - `shotnum` will be converted from list to np.array
@@ -499,7 +580,11 @@ class HDFReadData(np.ndarray):
                   '{} ms'.format((tt[-1] - tt[-2]) * 1.E3))
 
         # Initialize data array
-        data = np.empty(shape, dtype=dtype)
+        # - `obj` is allocated directly (no view-cast after the fill)
+        #   and filled through the plain ndarray view `data`, so field
+        #   access during the fill skips `__array_finalize__`
+        obj = np.ndarray.__new__(cls, shape, dtype=dtype)
+        data = obj.view(np.ndarray)
 
         # print execution timing
         if timeit:  # pragma: no cover
@@ -511,13 +596,15 @@ class HDFReadData(np.ndarray):
         data['shotnum'] = shotnum
 
         # fill 'signal' fields of data array
-        index = index.tolist()
+        # - evenly spaced indices (e.g. from a slice) and runs of
+        #   consecutive indices are read as hyperslabs instead of a
+        #   point selection (see `_read_rows`)
         if intersection_set:
             # fill signal
-            data['signal'] = dset[index, ...]
+            data['signal'] = _read_rows(dset, index)
         else:
             # fill signal
-            data['signal'][sni] = dset[index, ...]
+            data['signal'][sni] = _read_rows(dset, index)
             if np.issubdtype(data['signal'].dtype, np.integer):
                 data['signal'][np.logical_not(sni)] = 0
             else:
@@ -556,9 +643,6 @@ class HDFReadData(np.ndarray):
             print('tt - fill data array: '
                   '{} ms'.format((tt[-1] - tt[-2]) * 1.E3))
 
-        # Define obj to be returned
-        obj = data.view(cls)
-
         # get voltage offset
         try:
             voffset = dheader[0, 'Offset'] * u.volt
@@ -569,7 +653,7 @@ class HDFReadData(np.ndarray):
 
         # assign dataset meta-info
         obj._info = {
-            'source file': os.path.abspath(hdf_file.filename),
+            'source file': hdf_file.info['absolute file path'],
             'device group path': _dmap.info['group path'],
             'device dataset path': dpath + dname,
             'digitizer': d_info['digitizer'],
@@ -621,7 +705,11 @@ class HDFReadData(np.ndarray):
                 offset = abs(obj.info['voltage offset'].value)
 
                 # calc voltage
-                obj['signal'] = (obj.dv.value * obj['signal']) - offset
+                # - convert in-place on the float32 'signal' field to
+                #   avoid full-size temporaries
+                signal = data['signal']
+                signal *= obj.dv.value
+                signal -= offset
 
                 # update 'signal units'
                 obj._info['signal units'] = u.volt
@@ -642,39 +730,47 @@ class HDFReadData(np.ndarray):
             return
 
         # Define _info attribute
-        self._info = getattr(obj, '_info', {
-            'source file': None,
-            'device group path': None,
-            'device dataset path': None,
-            'configuration name': None,
-            'adc': None,
-            'bit': None,
-            'clock rate': None,
-            'sample average': None,
-            'shot average': None,
-            'board': None,
-            'channel': None,
-            'voltage offset': None,
-            'probe name': None,
-            'port': (None, None),
-            'signal units': None,
-            'controls': {},
-        })
+        # - the default dicts are only built if `obj` does not have
+        #   them (e.g. not for slices), instead of on every call
+        try:
+            self._info = obj._info
+        except AttributeError:
+            self._info = {
+                'source file': None,
+                'device group path': None,
+                'device dataset path': None,
+                'configuration name': None,
+                'adc': None,
+                'bit': None,
+                'clock rate': None,
+                'sample average': None,
+                'shot average': None,
+                'board': None,
+                'channel': None,
+                'voltage offset': None,
+                'probe name': None,
+                'port': (None, None),
+                'signal units': None,
+                'controls': {},
+            }
 
         # Define plasma attribute
-        self._plasma = getattr(obj, '_plasma', {
-            'Bo': None,
-            'kT': None,
-            'kTe': None,
-            'kTi': None,
-            'gamma': core.FloatUnit(1.0, 'arb'),
-            'm_e': core.ME,
-            'm_i': None,
-            'n': None,
-            'n_e': None,
-            'n_i': None,
-            'Z': None
-        })  # pragma: no cover
+        try:
+            self._plasma = obj._plasma
+        except AttributeError:
+            self._plasma = {
+                'Bo': None,
+                'kT': None,
+                'kTe': None,
+                'kTi': None,
+                'gamma': core.FloatUnit(1.0, 'arb'),
+                'm_e': core.ME,
+                'm_i': None,
+                'n': None,
+                'n_e': None,
+                'n_i': None,
+                'Z': None
+            }  # pragma: no cover
 
     def convert_signal(self, to_volt=False, to_bits=False, force=False):
         """converts signal from volts (bits) to bits (volts)"""
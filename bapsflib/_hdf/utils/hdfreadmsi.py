@@ -9,13 +9,34 @@
 #   license terms and contributor agreement.
 #
 #
-import bapsflib
 import copy
 import numpy as np
-import os
+
+from collections import OrderedDict
+from typing import (Dict, Tuple)
 
 from .file import File
 
+#: alias names of MSI diagnostics, mapped to the diagnostic name
+_ALIAS_MAP = {
+    alias: name
+    for name, aliases in (
+        ('Discharge', ('discharge',)),
+        ('Gas pressure', ('gas pressure',
+                          'pressure',
+                          'partial pressure',
+                          'partial pressures')),
+        ('Heater', ('heater',)),
+        ('Interferometer array', ('interferometer array',
+                                  'interferometer',
+                                  'interarr')),
+        ('Magnetic field', ('magnetic field',
+                            'b',
+                            'bfield')),
+    )
+    for alias in aliases
+}
+
 
 class HDFReadMSI(np.ndarray):
     """
@@ -102,24 +123,7 @@ class HDFReadMSI(np.ndarray):
             raise TypeError('arg `dname` needs to be a str')
 
         # allow for alias names of MSI diagnostics
-        aliases = [
-            ('Discharge', ['discharge']),
-            ('Gas pressure', ['gas pressure',
-                              'pressure',
-                              'partial pressure'
-                              'partial pressures']),
-            ('Heater', ['heater']),
-            ('Interferometer array', ['interferometer array',
-                                      'interferometer',
-                                      'interarr']),
-            ('Magnetic field', ['magnetic field',
-                                'b',
-                                'bfield']),
-        ]
-        for name, alias in aliases:
-            if dname.lower() in alias:
-                dname = name
-                break
+        dname = _ALIAS_MAP.get(dname.lower(), dname)
 
         # get diagnostic map
         # - assume if a map is successful, then it is formatted to
@@ -132,154 +136,78 @@ class HDFReadMSI(np.ndarray):
                 'Specified MSI Diagnostic is not among known'
                 'diagnostics')
 
-        # ---- Construct shape and dtype for np.ndarray             ----
-        #
-        # initialize dtype_list
-        # - this will be converted into dtype for np.ndarray
-        # - should look like:
-        #   dtype_list = [
-        #       ('shotnum', np.int32, ()),
-        #       ('signal', np.int32, (2, 100)),
-        #       ('meta',
-        #        [('f1', np.float32, ()), ('f2', np.int32, ())],
-        #        (2,)),
-        #   ]
-        #
-        # add 'shotnum' field
-        dtype_list = [
-            ('shotnum',
-             _map.configs['shotnum']['dtype'],
-             _map.configs['shotnum']['shape']),
-        ]
-
-        # add signal fields
-        for field in _map.configs['signals']:
-            dtype_list.append(
-                (field,
-                 _map.configs['signals'][field]['dtype'],
-                 _map.configs['signals'][field]['shape']),
-            )
-
-        # add 'meta' fields
-        # - all 'meta' fields needs to have the same number of rows as
-        #   the signal fields
+        # ---- Construct dtype and read plan                        ----
+        # - the plan only depends on the diagnostic map, so it is
+        #   cached on the file (reset when the file is re-mapped)
         #
-        meta_dtype_list = []
-        for field in _map.configs['meta']:
-            # skip the 'shape' field
-            if field == 'shape':
-                continue
-
-            # add to meta_dtype_list
-            meta_dtype_list.append(
-                (field,
-                 _map.configs['meta'][field]['dtype'],
-                 _map.configs['meta'][field]['shape']),
-            )
-
-        # add 'meta' to dtype_list
-        dtype_list.append(
-            ('meta',
-             meta_dtype_list,
-             _map.configs['meta']['shape']),
-        )
-
-        # define dtype
-        dtype = np.dtype(dtype_list)
-
-        # ---- Define and Populate Numpy Array                      ----
-        # create empty array
-        data = np.empty(_map.configs['shape'], dtype=dtype)
-
-        # fill 'shotnum'
-        sn_config = _map.configs['shotnum']
-        for ii, path in enumerate(sn_config['dset paths']):
-            # get dataset
-            dset = hdf_file[path]
-
-            # get field
-            field = sn_config['dset field'][0] \
-                if len(sn_config['dset field']) == 1 \
-                else sn_config['dset field'][ii]
-
-            # fill array
-            if ii == 0:
-                data['shotnum'] = dset[:, field]
-            else:
-                # ensure every data set has matching shot numbers
-                if not np.array_equal(data['shotnum'], dset[field]):
-                    raise ValueError(
-                        'Datasets do NOT have the same shot number '
-                        'values, do NOT know how to handle')
-
-        # fill 'signals'
-        # TODO: ADD ABILITY TO READ FROM A STRUCTURED DATASET
-        # - i.e. 'dset field' is not empty
-        sig_config = _map.configs['signals']
-        for field in sig_config:
-            if len(sig_config[field]['dset paths']) == 1:
-                # get dataset
-                path = sig_config[field]['dset paths'][0]
-                dset = hdf_file[path]
-
-                # fill array
-                data[field] = dset
-            else:
-                # there are multiple rows in the dataset
-                # (e.g. interferometer)
-                # - indices look like
-                #   [shot number, device number, time series]
-                #
-                for ii, path in \
-                        enumerate(sig_config[field]['dset paths']):
-                    # get dataset
-                    dset = hdf_file[path]
-
-                    # fill array
-                    data[field][:, ii, ...] = dset
-
-        # fill 'meta'
-        # TODO: ADD ABILITY TO READ FROM A REGULAR DATASET
-        # - i.e. 'dset field' is empty
-        meta_config = _map.configs['meta']
-        for field in meta_config:
-            # skip 'shape' key
-            if field == 'shape':
-                continue
-
-            # scan thru all datasets
-            for ii, path in enumerate(meta_config[field]['dset paths']):
-                # get dataset
-                dset = hdf_file[path]
-
-                # get dset_field
-                dset_field = meta_config[field]['dset field'][0] \
-                    if len(meta_config[field]['dset field']) == 1 \
-                    else meta_config[field]['dset field'][ii]
-
-                # fill array
-                if len(meta_config[field]['dset paths']) == 1:
-                    data['meta'][field] = dset[dset_field]
-                else:
-                    # there are multiple rows in the dataset
-                    # (e.g. interferometer)
-                    # - indices look like
-                    #   [shot number, device number, time series]
-                    #
-                    data['meta'][field][:, ii, ...] = dset[dset_field]
+        plans = hdf_file._msi_read_plans
+        try:
+            dtype, reads = plans[dname]
+        except KeyError:
+            dtype, reads = plans[dname] = _build_read_plan(_map)
 
         # ---- Define `obj`                                         ----
-        obj = data.view(cls)
+        # - allocate the subclassed array directly so the fill below
+        #   writes into its final memory (no view-cast afterwards)
+        obj = np.ndarray.__new__(cls, _map.configs['shape'],
+                                 dtype=dtype)
 
         # ---- Define `_info` attribute                             ----
         obj._info = {
-            'source file': os.path.abspath(hdf_file.filename),
+            'source file': hdf_file.info['absolute file path'],
             'device name': _map.info['group name'],
             'device group path': _map.info['group path']
         }
+        # - remaining configs are flat lists of attribute values, so a
+        #   shallow copy is enough to keep `info` detached from the map
         for key, val in _map.configs.items():
             if key not in ['shape', 'shotnum', 'signals', 'meta']:
-                obj._info[key] = copy.deepcopy(val)
+                obj._info[key] = copy.copy(val)
+
+        # ---- Populate `obj`                                       ----
+        # - one read per dataset
+        # - the dataset filling 'shotnum' is always read first, so
+        #   every other dataset can be checked for matching shot
+        #   numbers as soon as it is read
+        # - field views of `obj` are not C-contiguous, so datasets
+        #   can not be read directly into `obj`...instead datasets
+        #   are read into a scratch buffer that is reused by all
+        #   datasets of the same shape and dtype (e.g. the traces of
+        #   an interferometer array)
+        scratch = {}
+        for path, entries in reads.items():
+            dset = hdf_file[path]
+            try:
+                buf = scratch[(dset.shape, dset.dtype)]
+            except KeyError:
+                buf = np.empty(dset.shape, dtype=dset.dtype)
+                scratch[(dset.shape, dset.dtype)] = buf
+            if dset.size:
+                dset.read_direct(buf)
+
+            for dest_key, dset_field in entries:
+                # shot number check
+                if dest_key is None:
+                    if not np.array_equal(obj['shotnum'],
+                                          buf[dset_field]):
+                        raise ValueError(
+                            'Datasets do NOT have the same shot number '
+                            'values, do NOT know how to handle')
+                    continue
+
+                # get view of `obj` to fill
+                dest = obj
+                for index in dest_key:
+                    dest = dest[index]
+
+                if dset_field is None:
+                    src = buf
+                elif isinstance(dset_field, tuple):
+                    src = _rename_fields(buf[list(dset_field)],
+                                         dest.dtype.names)
+                else:
+                    src = buf[dset_field]
+                dest[...] = src
 
         # ---- Return `obj`                                         ----
         return obj
@@ -304,6 +232,166 @@ class HDFReadMSI(np.ndarray):
         return self._info
 
 
+def _build_read_plan(_map) -> Tuple[np.dtype, Dict[str, list]]:
+    """
+    Build the :class:`numpy.dtype` and read plan used by
+    :class:`HDFReadMSI` to read the MSI diagnostic mapped by `_map`.
+
+    The read plan groups all field assignments by dataset path, so
+    each dataset is read only once even when multiple fields
+    (e.g. :code:`'shotnum'` and :code:`'meta'` fields) are pulled from
+    the same dataset.  Each path maps to a list of
+    :code:`(dest_key, dset_field)` entries, where
+
+    * :code:`dest_key` is the sequence of indices giving the view of
+      the :class:`HDFReadMSI` array to fill (or :code:`None` for a
+      shot number check)
+    * :code:`dset_field` is the dataset field to read,
+      :code:`None` if the whole dataset is assigned, or a tuple of
+      fields if a whole :code:`'meta'` row is assigned
+
+    :param _map: MSI diagnostic mapping object
+    """
+    # ---- Construct dtype                                          ----
+    #
+    # initialize dtype_list
+    # - this will be converted into dtype for np.ndarray
+    # - should look like:
+    #   dtype_list = [
+    #       ('shotnum', np.int32, ()),
+    #       ('signal', np.int32, (2, 100)),
+    #       ('meta',
+    #        [('f1', np.float32, ()), ('f2', np.int32, ())],
+    #        (2,)),
+    #   ]
+    #
+    # add 'shotnum' field
+    dtype_list = [
+        ('shotnum',
+         _map.configs['shotnum']['dtype'],
+         _map.configs['shotnum']['shape']),
+    ]
+
+    # add signal fields
+    for field in _map.configs['signals']:
+        dtype_list.append(
+            (field,
+             _map.configs['signals'][field]['dtype'],
+             _map.configs['signals'][field]['shape']),
+        )
+
+    # add 'meta' fields
+    # - all 'meta' fields needs to have the same number of rows as
+    #   the signal fields
+    # - every key of the 'meta' config, except 'shape', is a field
+    #
+    meta_config = _map.configs['meta']
+    meta_fields = tuple(field for field in meta_config
+                        if field != 'shape')
+    meta_dtype_list = [
+        (field,
+         meta_config[field]['dtype'],
+         meta_config[field]['shape'])
+        for field in meta_fields
+    ]
+
+    # add 'meta' to dtype_list
+    dtype_list.append(
+        ('meta',
+         meta_dtype_list,
+         meta_config['shape']),
+    )
+
+    # define dtype
+    dtype = np.dtype(dtype_list)
+
+    # ---- Construct read plan                                      ----
+    # - ordered so the dataset filling 'shotnum' is read first
+    reads = OrderedDict()
+
+    # plan 'shotnum'
+    # - only the first dataset fills the 'shotnum' field, every
+    #   other dataset is checked for matching shot numbers
+    sn_config = _map.configs['shotnum']
+    for ii, path in enumerate(sn_config['dset paths']):
+        # get field
+        field = sn_config['dset field'][0] \
+            if len(sn_config['dset field']) == 1 \
+            else sn_config['dset field'][ii]
+
+        dest_key = ('shotnum',) if ii == 0 else None
+        reads.setdefault(path, []).append((dest_key, field))
+
+    # plan 'signals'
+    # TODO: ADD ABILITY TO READ FROM A STRUCTURED DATASET
+    # - i.e. 'dset field' is not empty
+    sig_config = _map.configs['signals']
+    for field in sig_config:
+        paths = sig_config[field]['dset paths']
+        for ii, path in enumerate(paths):
+            # there are multiple rows in the dataset when there
+            # are multiple paths (e.g. interferometer)
+            # - indices look like
+            #   [shot number, device number, time series]
+            #
+            dest_key = (field,) if len(paths) == 1 \
+                else (field, (slice(None), ii, Ellipsis))
+            reads.setdefault(path, []).append((dest_key, None))
+
+    # plan 'meta'
+    # - 'meta' fields are grouped by the dataset (and row) they
+    #   are pulled from, if a dataset supplies every 'meta' field
+    #   then the whole 'meta' row is copied in one structured
+    #   assignment
+    # TODO: ADD ABILITY TO READ FROM A REGULAR DATASET
+    # - i.e. 'dset field' is empty
+    meta_rows = {}
+    for field in meta_fields:
+        paths = meta_config[field]['dset paths']
+        for ii, path in enumerate(paths):
+            # get dset_field
+            dset_field = meta_config[field]['dset field'][0] \
+                if len(meta_config[field]['dset field']) == 1 \
+                else meta_config[field]['dset field'][ii]
+
+            # there are multiple rows in the dataset when there
+            # are multiple paths (e.g. interferometer)
+            row = None if len(paths) == 1 else ii
+            meta_rows.setdefault((path, row), []).append(
+                (field, dset_field))
+
+    for (path, row), fields in meta_rows.items():
+        row_key = ('meta',) if row is None \
+            else ('meta', (slice(None), row, Ellipsis))
+        names, dset_fields = zip(*fields)
+        if names == meta_fields \
+                and len(set(dset_fields)) == len(dset_fields):
+            reads.setdefault(path, []).append((row_key, dset_fields))
+        else:
+            for field, dset_field in fields:
+                reads.setdefault(path, []).append(
+                    (row_key + (field,), dset_field))
+
+    return dtype, reads
+
+
+def _rename_fields(arr: np.ndarray, names) -> np.ndarray:
+    """
+    Return a view of structured array `arr` with its fields renamed
+    to `names` (matched by position).  This keeps structured
+    assignment consistent whether :mod:`numpy` assigns fields by
+    name or by position.
+    """
+    fields = arr.dtype.fields
+    dtype = np.dtype({
+        'names': list(names),
+        'formats': [fields[name][0] for name in arr.dtype.names],
+        'offsets': [fields[name][1] for name in arr.dtype.names],
+        'itemsize': arr.dtype.itemsize,
+    })
+    return arr.view(dtype)
+
+
 # add example to __new__ docstring
 HDFReadMSI.__new__.__doc__ += "\n"
 for line in HDFReadMSI.__example_doc__.splitlines():
@@ -17,7 +17,8 @@ import numpy as np
 
 from bapsflib._hdf.maps.controls.templates import \
     (HDFMapControlTemplate, HDFMapControlCLTemplate)
-from typing import (Any, Dict, Iterable, List, Tuple, Union)
+from functools import singledispatch
+from typing import (Any, Dict, List, Tuple, Union)
 
 from .file import File
 
@@ -377,7 +378,8 @@ def condition_controls(hdf_file: File,
     .. admonition:: Condition Criteria
 
         #. Input **controls** should be
-           :code:`Union[str, Iterable[Union[str, Tuple[str, Any]]]]`
+           :code:`Union[str, List[Union[str, Tuple[str, Any]]]]`
+           (a :code:`tuple` may be used in place of the :code:`list`)
         #. There can only be one control for each
            :class:`~bapsflib._hdf.maps.controls.contype.ConType`.
         #. If a control has multiple configurations, then one must be
@@ -385,12 +387,13 @@ def condition_controls(hdf_file: File,
         #. If a control has ONLY ONE configuration, then that will be
            assumed (and checked against the specified configuration).
     """
-    # grab instance of file mapping
-    _fmap = hdf_file.file_map
+    # grab lookup table of control configurations and contypes
+    # - built once per file mapping
+    controls_lookup = hdf_file._controls_lookup
 
     # -- condition 'controls' argument                              ----
     # - controls is:
-    #   1. a string or Iterable
+    #   1. a string, list, or tuple
     #   2. each element is either a string or tuple
     #   3. if tuple, then length <= 2
     #      ('control name',) or ('control_name', config_name)
@@ -404,15 +407,19 @@ def condition_controls(hdf_file: File,
     if isinstance(controls, str):
         controls = [controls]
 
-    # condition Iterable
-    if isinstance(controls, Iterable):
+    # condition list/tuple
+    if isinstance(controls, (list, tuple)):
         # all list items have to be strings or tuples
         if not all(isinstance(con, (str, tuple)) for con in controls):
             raise TypeError('all elements of `controls` must be of '
                             'type string or tuple')
 
         # condition controls
+        # - track seen names and contypes in sets so duplicate
+        #   checks are hashed lookups
         new_controls = []
+        seen_names = set()
+        seen_contypes = set()
         for control in controls:
             if isinstance(control, str):
                 name = control
@@ -429,53 +436,50 @@ def condition_controls(hdf_file: File,
                 config_name = None if len(control) == 1 else control[1]
 
             # ensure proper control and configuration name are defined
-            if name in [cc[0] for cc in new_controls]:
+            if name in seen_names:
                 raise ValueError(
-                    'Control device ({})'.format(control)
-                    + ' can only have one occurrence in controls')
-            elif name in _fmap.controls:
-                if config_name in _fmap.controls[name].configs:
+                    'Control device ({}) can only have one occurrence '
+                    'in controls'.format(control))
+            elif name in controls_lookup:
+                configs, default_config, contype = controls_lookup[name]
+                if config_name in configs:
                     # all is good
                     pass
-                elif len(_fmap.controls[name].configs) == 1 \
-                        and config_name is None:
-                    config_name = list(_fmap.controls[name].configs)[0]
+                elif default_config is not None and config_name is None:
+                    # control has only ONE configuration
+                    config_name = default_config
                 else:
                     raise ValueError(
-                        "'{}' is not a valid ".format(config_name)
-                        + "configuration name for control device "
-                        + "'{}'".format(name))
+                        "'{}' is not a valid configuration name for "
+                        "control device '{}'".format(config_name, name))
             else:
-                raise ValueError('Control device ({})'.format(name)
-                                 + ' not in HDF5 file')
+                raise ValueError(
+                    'Control device ({}) not in HDF5 file'.format(name))
+
+            # enforce one control per contype
+            if contype in seen_contypes:
+                raise TypeError('`controls` has multiple devices per '
+                                'contype')
 
             # add control to new_controls
             new_controls.append((name, config_name))
+            seen_names.add(name)
+            seen_contypes.add(contype)
     else:
-        raise TypeError('`controls` argument is not Iterable')
+        raise TypeError('`controls` argument is not a string, list, '
+                        'or tuple')
 
     # re-assign `controls`
     controls = new_controls
 
-    # enforce one control per contype
-    checked = []
-    for control in controls:
-        # control is a tuple, not a string
-        contype = _fmap.controls[control[0]].contype
-
-        if contype in checked:
-            raise TypeError('`controls` has multiple devices per '
-                            'contype')
-        else:
-            checked.append(contype)
-
     # return conditioned list
     return controls
 
 
 def condition_shotnum(shotnum: Any,
                       dset_dict: Dict[str, h5py.Dataset],
-                      shotnumkey_dict: Dict[str, str]) -> np.ndarray:
+                      shotnumkey_dict: Dict[str, str],
+                      hdf_file: File = None) -> np.ndarray:
     """
     Conditions the **shotnum** argument for
     :class:`~bapsflib._hdf.utils.hdfreadcontrols.HDFReadControls` and
@@ -485,105 +489,217 @@ def condition_shotnum(shotnum: Any,
     :param dset_dict: dictionary of all control dataset instances
     :param shotnumkey_dict: dictionary of the shot number field name
         for each control dataset in dset_dict
-    :return: conditioned **shotnum** numpy array
+    :param hdf_file: HDF5 file object containing the datasets in
+        dset_dict, used to cache the datasets' last shot numbers when
+        the file is opened read-only (optional)
+    :return: conditioned **shotnum** numpy array (read-only)
 
     .. admonition:: Condition Criteria
 
         #. Input **shotnum** should be
            :code:`Union[int, List[int,...], slice, np.ndarray]`
+           (:code:`int` includes numpy integer scalars)
+        #. A :code:`list` is converted to a :code:`np.ndarray` and
+           conditioned the same way.  So, its elements may be numpy
+           integer scalars, a list of only :code:`bool` values is
+           rejected, and a nested list is accepted if it squeezes to
+           one dimension (e.g. :code:`[[1], [2]]`).
         #. Any :math:`\mathbf{shotnum} \le 0` will be removed.
         #. A :code:`ValueError` will be thrown if the conditioned array
            is NULL.
     """
     # Acceptable `shotnum` types
-    # 1. int
+    # 1. int (including numpy integers, but not bool)
     # 2. slice() object
-    # 3. List[int, ...]
+    # 3. List[int, ...] (handled like a np.array)
     # 4. np.array (dtype = np.integer and ndim = 1)
     #
     # Catch each `shotnum` type and convert to numpy array
+    # - dispatching is done on type(shotnum) by _condition_shotnum
     #
-    if isinstance(shotnum, int):
-        if shotnum <= 0 or isinstance(shotnum, bool):
-            raise ValueError(
-                "Valid `shotnum` ({})".format(shotnum)
-                + " not passed. Resulting array would be NULL.")
-
-        # convert
-        shotnum = np.array([shotnum], dtype=np.uint32)
-
-    elif isinstance(shotnum, list):
-        # ensure all elements are int
-        if not all(isinstance(sn, int) for sn in shotnum):
-            raise ValueError('Valid `shotnum` not passed. All values '
-                             'NOT int.')
-
-        # remove shot numbers <= 0
-        shotnum.sort()
-        shotnum = list(set(shotnum))
-        shotnum.sort()
-        if min(shotnum) <= 0:
-            # remove values less-than or equal to 0
-            new_sn = [sn for sn in shotnum if sn > 0]
-            shotnum = new_sn
-
-        # ensure not NULL
-        if len(shotnum) == 0:
-            raise ValueError('Valid `shotnum` not passed. Resulting '
-                             'array would be NULL')
-
-        # convert
-        shotnum = np.array(shotnum, dtype=np.uint32)
-
-    elif isinstance(shotnum, slice):
-        # determine largest possible shot number
+    shotnum = _condition_shotnum(shotnum, dset_dict, shotnumkey_dict,
+                                 hdf_file)
+
+    # return as read-only so the array can be shared without copies
+    shotnum.setflags(write=False)
+    return shotnum
+
+
+@singledispatch
+def _condition_shotnum(shotnum: Any,
+                       dset_dict: Dict[str, h5py.Dataset],
+                       shotnumkey_dict: Dict[str, str],
+                       hdf_file: File) -> np.ndarray:
+    """
+    Type dispatcher for :func:`condition_shotnum`.  Unregistered
+    **shotnum** types are invalid.
+    """
+    raise ValueError('Valid `shotnum` not passed')
+
+
+@_condition_shotnum.register(bool)
+@_condition_shotnum.register(np.bool_)
+def _condition_shotnum_bool(shotnum, dset_dict, shotnumkey_dict,
+                            hdf_file):
+    # bool is a subclass of int, but is not a valid shot number
+    raise ValueError('Valid `shotnum` not passed')
+
+
+@_condition_shotnum.register(int)
+@_condition_shotnum.register(np.integer)
+def _condition_shotnum_int(shotnum, dset_dict, shotnumkey_dict,
+                           hdf_file):
+    if shotnum <= 0:
+        raise ValueError(
+            "Valid `shotnum` ({}) not passed. Resulting array would "
+            "be NULL.".format(shotnum))
+
+    # convert
+    return np.array([int(shotnum)], dtype=np.uint32)
+
+
+@_condition_shotnum.register(slice)
+def _condition_shotnum_slice(shotnum, dset_dict, shotnumkey_dict,
+                             hdf_file):
+    # determine largest possible shot number
+    if shotnum.stop is not None and shotnum.stop > 0 \
+            and (shotnum.start is None or shotnum.start >= 0) \
+            and (shotnum.step is None or shotnum.step > 0):
+        # slice is fully bounded by `stop`, so the datasets do not
+        # need to be probed for their last shot number
+        stop_sn = shotnum.stop
+    else:
         last_sn = [
-            dset_dict[cname][-1, shotnumkey_dict[cname]] + 1
+            _last_shotnum(dset_dict[cname], shotnumkey_dict[cname],
+                          hdf_file) + 1
             for cname in dset_dict
         ]
         if shotnum.stop is not None:
             last_sn.append(shotnum.stop)
         stop_sn = max(last_sn)
 
-        # get the start, stop, and step for the shot number array
-        start, stop, step = shotnum.indices(stop_sn)
-
-        # re-define `shotnum`
-        shotnum = np.arange(start, stop, step, dtype=np.int32)
-
-        # remove shot numbers <= 0
-        shotnum = np.delete(shotnum, np.where(shotnum <= 0)[0])
-        shotnum = shotnum.astype(np.uint32)
-
-        # ensure not NULL
-        if shotnum.size == 0:
-            raise ValueError('Valid `shotnum` not passed. Resulting '
-                             'array would be NULL')
-
-    elif isinstance(shotnum, np.ndarray):
-        if shotnum.ndim != 1:
-            shotnum = shotnum.squeeze()
-        if shotnum.ndim != 1 \
-                or not np.issubdtype(shotnum.dtype, np.integer) \
-                or bool(shotnum.dtype.names):
-            raise ValueError('Valid `shotnum` not passed')
-
-        # remove shot numbers <= 0
-        shotnum.sort()
-        shotnum = np.delete(shotnum, np.where(shotnum <= 0)[0])
-        shotnum = shotnum.astype(np.uint32)
-
-        # ensure not NULL
-        if shotnum.size == 0:
-            raise ValueError('Valid `shotnum` not passed. Resulting '
-                             'array would be NULL')
+    # get the start, stop, and step for the shot number array
+    start, stop, step = shotnum.indices(stop_sn)
+
+    # re-define `shotnum`
+    # - bounds are adjusted so shot numbers <= 0 are never generated
+    if step > 0:
+        if start <= 0:
+            # advance start to the first positive value of the sequence
+            start += (-start // step + 1) * step
+        shotnum = np.arange(start, stop, step, dtype=np.uint32)
     else:
+        # stop the descending sequence before reaching 0
+        shotnum = np.arange(start, max(stop, 0), step, dtype=np.int64)
+        shotnum = shotnum.astype(np.uint32, copy=False)
+
+    # ensure not NULL
+    if shotnum.size == 0:
+        raise ValueError('Valid `shotnum` not passed. Resulting '
+                         'array would be NULL')
+
+    return shotnum
+
+
+@_condition_shotnum.register(list)
+@_condition_shotnum.register(np.ndarray)
+def _condition_shotnum_array(shotnum, dset_dict, shotnumkey_dict,
+                             hdf_file):
+    # convert list to a numpy array
+    # - numpy determines the common dtype while converting, so
+    #   non-int elements result in a non-integer (e.g. object) dtype
+    shotnum = np.asarray(shotnum)
+
+    # ensure 1D array of integers
+    if shotnum.ndim != 1:
+        shotnum = shotnum.squeeze()
+    if shotnum.ndim != 1 \
+            or not np.issubdtype(shotnum.dtype, np.integer) \
+            or bool(shotnum.dtype.names):
         raise ValueError('Valid `shotnum` not passed')
 
-    # return
+    # remove shot numbers <= 0, then sort and remove duplicates
+    # - the caller's array is never mutated
+    shotnum = _filter_positive_unique(shotnum)
+
+    # ensure not NULL
+    if shotnum.size == 0:
+        raise ValueError('Valid `shotnum` not passed. Resulting '
+                         'array would be NULL')
+
     return shotnum
 
 
+def _filter_positive_unique(arr: np.ndarray) -> np.ndarray:
+    """
+    Removes all values :math:`\le 0` from the 1D integer array **arr**
+    and returns the sorted unique values as a new :code:`np.uint32`
+    array.  **arr** is not modified.
+
+    Shot number arrays are typically already sorted and unique (e.g.
+    generated by :func:`numpy.arange`), so that is checked for with a
+    single O(n) pass.  In that case the values :math:`\le 0` are cut
+    with a binary search (:func:`numpy.searchsorted`) instead of a
+    mask, otherwise the array is masked and passed through
+    :func:`numpy.unique`.
+    """
+    if arr.size <= 1 or np.all(arr[1:] > arr[:-1]):
+        # arr is sorted and unique
+        # - cut values <= 0 with a binary search
+        # - astype() returns a copy, so arr is not aliased
+        cut = np.searchsorted(arr, 0, side='right')
+        return arr[cut:].astype(np.uint32)
+
+    # remove values <= 0, then sort and remove duplicates
+    arr = np.unique(arr[arr > 0])
+
+    return arr.astype(np.uint32, copy=False)
+
+
+def _last_shotnum(dset: h5py.Dataset, shotnumkey: str,
+                  hdf_file: File = None) -> int:
+    """
+    Returns the shot number recorded in the last row of dataset
+    **dset**.
+
+    If **hdf_file** is given and was opened read-only
+    (:code:`mode='r'`), the value is cached on the file object (keyed
+    on the dataset name and **shotnumkey**), so repeated calls do not
+    re-read the HDF5 file.  The cache is only valid for read-only
+    files, since datasets of writable files can change in place, and
+    it is reset whenever the file is re-mapped.
+
+    :param dset: dataset containing shot numbers
+    :type dset: :class:`h5py.Dataset`
+    :param str shotnumkey: field name in the dataset that contains
+        the shot numbers
+    :param hdf_file: HDF5 file object containing **dset** (optional)
+    """
+    if hdf_file is None or hdf_file.mode != 'r':
+        return _read_last_shotnum(dset, shotnumkey)
+
+    key = (dset.name, shotnumkey)
+    try:
+        last_sn = hdf_file._last_shotnum_cache[key]
+    except KeyError:
+        last_sn = _read_last_shotnum(dset, shotnumkey)
+        hdf_file._last_shotnum_cache[key] = last_sn
+
+    return last_sn
+
+
+def _read_last_shotnum(dset: h5py.Dataset, shotnumkey: str) -> int:
+    """
+    Reads the shot number recorded in the last row of dataset **dset**.
+    Only the **shotnumkey** field is read when
+    :meth:`h5py.Dataset.fields` is available (:code:`h5py >= 3.0`).
+    """
+    if hasattr(dset, 'fields'):
+        return int(dset.fields(shotnumkey)[-1])
+    else:  # pragma: no cover
+        return int(dset[-1, shotnumkey])
+
+
 def do_shotnum_intersection(
         shotnum: np.ndarray,
         sni_dict: IndexDict,
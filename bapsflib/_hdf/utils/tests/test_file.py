@@ -88,6 +88,27 @@ class TestFile(TestBase):
         self.assertIsInstance(type(_bf).msi, property)
         self.assertIs(_bf.msi, _bf.file_map.msi)
 
+        # `_controls_lookup`
+        self.f.add_module('Waveform',
+                          mod_args={'n_configs': 1, 'sn_size': 100})
+        _bf._map_file()
+        self.assertIsNone(_bf._controls_lookup_cache)
+        cmap = _bf.controls['Waveform']
+        self.assertEqual(
+            _bf._controls_lookup,
+            {'Waveform': (frozenset(['config01']), 'config01',
+                          cmap.contype)})
+        self.assertIs(_bf._controls_lookup, _bf._controls_lookup_cache)
+
+        self.f.modules['Waveform'].knobs.n_configs = 3
+        _bf._map_file()
+        self.assertIsNone(_bf._controls_lookup_cache)
+        self.assertEqual(
+            _bf._controls_lookup['Waveform'][0:2],
+            (frozenset(['config01', 'config02', 'config03']), None))
+        self.f.remove_all_modules()
+        _bf._map_file()
+
         # `overview` attribute                                      ----
         self.assertTrue(hasattr(_bf, 'overview'))
         self.assertIsInstance(type(_bf).overview, property)
@@ -159,6 +180,10 @@ class TestFile(TestBase):
             _bf2.close()
 
         # `mode` calling
+        # - the chunk cache size defaults to DEFAULT_RDCC_NBYTES
+        extras = {}
+        if h5py.version.version_tuple[:2] >= (2, 9):
+            extras['rdcc_nbytes'] = File.DEFAULT_RDCC_NBYTES
         with mock.patch('h5py.File.__init__',
                         wraps=h5py.File.__init__) as mock_file:
             for mode in ('r', 'r+'):
@@ -170,10 +195,22 @@ class TestFile(TestBase):
                             silent=True)
                 self.assertTrue(mock_file.called)
                 mock_file.assert_called_once_with(_bf2, self.f.filename,
-                                                  mode=mode)
+                                                  mode=mode, **extras)
                 mock_file.reset_mock()
                 _bf2.close()
 
+            # user specified chunk cache size is not overridden
+            _bf2 = File(self.f.filename,
+                        control_path='Raw data + config',
+                        digitizer_path='Raw data + config',
+                        msi_path='MSI',
+                        silent=True,
+                        rdcc_nbytes=2 * 1024 ** 2)
+            mock_file.assert_called_once_with(_bf2, self.f.filename,
+                                              mode='r',
+                                              rdcc_nbytes=2 * 1024 ** 2)
+            _bf2.close()
+
         # raise ValueError if mode not in ('r', 'r+')
         with self.assertRaises(ValueError):
             _bf2 = File(self.f.filename, mode='w')
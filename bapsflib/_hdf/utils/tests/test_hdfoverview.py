@@ -440,6 +440,27 @@ class TestHDFOverview(TestBase):
             self.assertTrue(mock_values['report_discovery'].called)
             self.assertTrue(mock_values['report_details'].called)
 
+        # "flush" StringIO
+        mock_stdout.truncate(0)
+        mock_stdout.seek(0)
+        self.assertEqual(mock_stdout.getvalue(), '')
+
+        # output of a report section that raises is still printed
+        def report_w_error():
+            print('partial report')
+            raise RuntimeError
+
+        with mock.patch.multiple(
+                _overview.__class__,
+                report_general=mock.DEFAULT,
+                report_discovery=mock.DEFAULT,
+                report_details=mock.DEFAULT) as mock_values:
+            mock_values['report_discovery'].side_effect = report_w_error
+            with self.assertRaises(RuntimeError):
+                _overview.print()
+            self.assertIn('partial report', mock_stdout.getvalue())
+            self.assertFalse(mock_values['report_details'].called)
+
     @with_bf
     @mock.patch('__main__.__builtins__.open',
                 new_callable=mock.mock_open)
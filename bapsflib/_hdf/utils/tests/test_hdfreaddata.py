@@ -24,7 +24,8 @@ from unittest import mock
 from . import (TestBase, with_bf)
 from ..file import File
 from ..hdfreadcontrols import HDFReadControls
-from ..hdfreaddata import (build_sndr_for_simple_dset,
+from ..hdfreaddata import (_index_runs, _index_selection, _read_rows,
+                           build_sndr_for_simple_dset,
                            condition_shotnum,
                            do_shotnum_intersection,
                            HDFReadData)
@@ -254,6 +255,15 @@ class TestHDFReadData(TestBase):
             self.assertEqual(data.info['adc'], adc)
             mock_cdn.reset_mock()
 
+            # dataset names are cached for an explicit `config_name`
+            # and `adc`
+            data = HDFReadData(_bf, brd, ch, adc=adc, digitizer=digi,
+                               config_name=config_name)
+            self.assertFalse(mock_cdn.called)
+            self.assertDataObj(data, _bf)
+            self.assertEqual(data.info['adc'], adc)
+            mock_cdn.reset_mock()
+
             # not a configuration name
             with self.assertRaises(ValueError):
                 data = HDFReadData(_bf, brd, ch, adc='not an adc',
@@ -718,6 +728,10 @@ class TestHDFReadData(TestBase):
         self.assertIsInstance(data.dt, u.Quantity)
         self.assertEqual(data.dt.value, dt)
         self.assertEqual(data.dt.unit, u.s)
+
+        # `info` item modified in-place
+        data.info['clock rate'] *= 2
+        self.assertEqual(data.dt.value, dt / 2.0)
         data.info['clock rate'] = old_cr
         data.info['sample average'] = old_ave
 
@@ -865,6 +879,49 @@ class TestHDFReadData(TestBase):
                                index=[-sn_size - 10])
             self.assertDataObj(data, _bf)
 
+    @with_bf
+    def test_read_w_sparse_index(self, _bf: File):
+        """
+        Test reading data using an `index` of separated runs of
+        consecutive rows.
+        """
+        # setup
+        self.f.add_module('SIS 3301',
+                          {'n_configs': 1, 'sn_size': 50, 'nt': 100})
+        _mod = self.f.modules['SIS 3301']
+        digi = 'SIS 3301'
+        adc = 'SIS 3301'
+        config_name = _mod.knobs.active_config[0]
+        bc_arr = _mod.knobs.active_brdch
+        bc_indices = np.where(bc_arr)
+        brd = bc_indices[0][0]
+        ch = bc_indices[1][0]
+        _bf._map_file()  # re-map file
+        digi_path = 'Raw data + config/SIS 3301'
+        dset_name = config_name + " [{}:{}]".format(brd, ch)
+        dset_path = digi_path + '/' + dset_name
+        dset = _bf.get(dset_path)
+        dheader = _bf.get(dset_path + ' headers')
+        shotnumkey = 'Shot'
+
+        # give every row distinct values
+        self.f[dset_path][...] = np.arange(
+            dset.size, dtype=np.int16).reshape(dset.shape)
+
+        # rows are read run by run
+        indices = [1, 2, 3, 10, 11, 30]
+        for keep_bits in (False, True):
+            with self.subTest(keep_bits=keep_bits):
+                data = HDFReadData(_bf, brd, ch,
+                                   config_name=config_name,
+                                   adc=adc, digitizer=digi,
+                                   index=indices, keep_bits=keep_bits)
+                self.assertDataObj(data, _bf, keep_bits=keep_bits)
+                self.assertTrue(np.array_equal(
+                    data['shotnum'], dheader[indices, shotnumkey]))
+                self.assertDataArrayValues(data, dset, indices,
+                                           keep_bits=keep_bits)
+
     @with_bf
     @mock.patch('bapsflib._hdf.utils.hdfreaddata.condition_shotnum',
                 side_effect=condition_shotnum)
@@ -1122,5 +1179,66 @@ class TestHDFReadData(TestBase):
                     self.assertTrue(np.all(np.isnan(data['xyz'])))
 
 
+class TestIndexSelection(ut.TestCase):
+    """
+    Test Case for the row selection helpers of
+    :mod:`~bapsflib._hdf.utils.hdfreaddata`.
+    """
+
+    def test_selection(self):
+        # (index, expected selection)
+        cases = [
+            (np.array([], dtype=np.int32), []),
+            (np.array([5]), slice(5, 6)),
+            (np.arange(3, 20), slice(3, 20, 1)),
+            (np.arange(2, 40, 3), slice(2, 39, 3)),
+            (np.array([1, 2, 3, 10, 11, 30]), [1, 2, 3, 10, 11, 30]),
+        ]
+        for index, expected in cases:
+            with self.subTest(index=index):
+                sel = _index_selection(index)
+                self.assertEqual(sel, expected)
+
+                # selection gives the same rows as `index`
+                arr = np.arange(50)
+                np.testing.assert_array_equal(arr[sel], arr[index])
+
+    def test_runs(self):
+        # (index, expected runs)
+        cases = [
+            (np.array([], dtype=np.int32), []),
+            (np.array([5]), [slice(5, 6)]),
+            (np.arange(3, 20), [slice(3, 20)]),
+            (np.array([1, 2, 3, 10, 11, 30]),
+             [slice(1, 4), slice(10, 12), slice(30, 31)]),
+        ]
+        for index, expected in cases:
+            with self.subTest(index=index):
+                self.assertEqual(_index_runs(index), expected)
+
+    def test_read_rows(self):
+        arr = np.arange(200, dtype=np.int16).reshape(50, 4)
+        with h5py.File('test_read_rows.hdf5', 'w', driver='core',
+                       backing_store=False) as f:
+            dset = f.create_dataset('dset', data=arr)
+            indices = [
+                np.array([5]),
+                np.arange(2, 40, 3),
+                np.array([1, 2, 3, 10, 11, 30]),  # read by runs
+                np.array([4, 8, 9]),  # read as point selection
+            ]
+            for index in indices:
+                with self.subTest(index=index), \
+                        mock.patch.object(
+                            dset, 'read_direct',
+                            wraps=dset.read_direct) as mock_rd:
+                    data = _read_rows(dset, index)
+                    np.testing.assert_array_equal(data, arr[index])
+                    self.assertEqual(data.dtype, arr.dtype)
+                    self.assertEqual(
+                        mock_rd.call_count,
+                        3 if index.size == 6 else 0)
+
+
 if __name__ == '__main__':
     ut.main()
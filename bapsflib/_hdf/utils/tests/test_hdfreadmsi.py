@@ -77,6 +77,18 @@ class TestHDFReadMSI(TestBase):
         with self.assertRaises(ValueError):
             self.read(_bf, 'Interferometer array')
 
+    @with_bf
+    def test_aliases(self, _bf: File):
+        """Test reading MSI diagnostics by an alias name"""
+        self.f.add_module('Gas pressure')
+        _bf._map_file()  # re-map file
+        for alias in ('gas pressure', 'Pressure', 'partial pressure',
+                      'partial pressures'):
+            with self.subTest(alias=alias):
+                data = self.read(_bf, alias)
+                self.assertEqual(data.info['device name'],
+                                 'Gas pressure')
+
     @with_bf
     def test_read_simple(self, _bf: File):
         """
@@ -89,6 +101,12 @@ class TestHDFReadMSI(TestBase):
         _map = _bf.file_map.msi['Discharge']
         self.assertDataObj(self.read(_bf, 'Discharge'), _bf, _map)
 
+        # dtype and read plan are cached until the file is re-mapped
+        self.assertIn('Discharge', _bf._msi_read_plans)
+        self.assertDataObj(self.read(_bf, 'discharge'), _bf, _map)
+        _bf._map_file()
+        self.assertEqual(_bf._msi_read_plans, {})
+
     @with_bf
     def test_read_complex(self, _bf: File):
         """
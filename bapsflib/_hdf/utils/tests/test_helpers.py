@@ -16,6 +16,7 @@ import unittest as ut
 
 from bapsflib._hdf.maps.controls.waveform import HDFMapControlWaveform
 from numpy.lib import recfunctions as rfn
+from unittest import mock
 
 from . import (TestBase, with_bf)
 from ..file import File
@@ -251,8 +252,10 @@ class TestConditionControls(TestBase):
         # `controls` is Null
         self.assertRaises(ValueError, condition_controls, _bf, [])
 
-        # `controls` is not a string or Iterable
+        # `controls` is not a string, list, or tuple
         self.assertRaises(TypeError, condition_controls, _bf, True)
+        self.assertRaises(TypeError, condition_controls, _bf,
+                          (con for con in ['Waveform']))
 
         # 'controls` element is not a str or tuple
         self.assertRaises(TypeError,
@@ -551,13 +554,13 @@ class TestConditionShotnum(TestBase):
 
     def test_shotnum_int(self):
         # shotnum <= 0 (invalid)
-        sn = [-20, 0]
+        sn = [-20, 0, np.int32(-5)]
         for shotnum in sn:
             with self.assertRaises(ValueError):
                 _sn = condition_shotnum(shotnum, {}, {})
 
         # shotnum > 0 (valid)
-        sn = [1, 100]
+        sn = [1, 100, np.int64(5), np.uint32(20)]
         for shotnum in sn:
             _sn = condition_shotnum(shotnum, {}, {})
 
@@ -565,12 +568,22 @@ class TestConditionShotnum(TestBase):
             self.assertEqual(_sn.shape, (1,))
             self.assertTrue(np.issubdtype(_sn.dtype, np.uint32))
             self.assertEqual(_sn[0], shotnum)
+            self.assertFalse(_sn.flags.writeable)
+
+        # modifying a returned array does not affect later calls
+        _sn = condition_shotnum(5, {}, {})
+        _sn.setflags(write=True)
+        _sn[0] = 6
+        self.assertEqual(condition_shotnum(5, {}, {})[0], 5)
 
     def test_shotnum_list(self):
         # not all list elements are integers
         sn = [
             [0, 1, None],
             [1.5, 2.6],
+            [1, 2.5],
+            [[1, 2], [3, 4]],
+            [True, False],
         ]
         for shotnum in sn:
             with self.assertRaises(ValueError):
@@ -590,6 +603,9 @@ class TestConditionShotnum(TestBase):
             ([0, 1, 5, 8], np.array([1, 5, 8], dtype=np.uint32)),
             ([-20, -5, 10], np.array([10], dtype=np.uint32)),
             ([1, 2, 4], np.array([1, 2, 4], dtype=np.uint32)),
+            ([[5], [2]], np.array([2, 5], dtype=np.uint32)),
+            ([np.int64(3), np.int64(1)],
+             np.array([1, 3], dtype=np.uint32)),
         ]
         for shotnum, ex_sn in sn:
             _sn = condition_shotnum(shotnum, {}, {})
@@ -632,6 +648,14 @@ class TestConditionShotnum(TestBase):
              np.array([5, 6, 7, 8, 9], dtype=np.uint32)),
             (slice(-2, -1),
              np.array([6], dtype=np.uint32)),
+            (slice(6, 2, -2),
+             np.array([6, 4], dtype=np.uint32)),
+            (slice(None, 5, -3),
+             np.array([7], dtype=np.uint32)),
+            (slice(0, 10, 3),
+             np.array([3, 6, 9], dtype=np.uint32)),
+            (slice(None, None, -3),
+             np.array([7, 4, 1], dtype=np.uint32)),
         ]
         for shotnum, ex_sn in sn:
             _sn = condition_shotnum(shotnum, dset_dict, shotnumkey_dict)
@@ -639,6 +663,23 @@ class TestConditionShotnum(TestBase):
             self.assertIsInstance(_sn, np.ndarray)
             self.assertTrue(np.array_equal(_sn, ex_sn))
 
+        # last shot numbers are cached on a read-only `hdf_file`
+        hdf_file = mock.Mock(mode='r', _last_shotnum_cache={})
+        _sn = condition_shotnum(slice(None), dset_dict, shotnumkey_dict,
+                                hdf_file=hdf_file)
+        self.assertTrue(np.array_equal(_sn, sn[0][1]))
+        self.assertEqual(hdf_file._last_shotnum_cache, {
+            ('/d1', 'Shot number'): 5,
+            ('/d2', 'Shot number'): 7,
+        })
+
+        # ...but not on a writable `hdf_file`
+        hdf_file = mock.Mock(mode='r+', _last_shotnum_cache={})
+        _sn = condition_shotnum(slice(None), dset_dict, shotnumkey_dict,
+                                hdf_file=hdf_file)
+        self.assertTrue(np.array_equal(_sn, sn[0][1]))
+        self.assertEqual(hdf_file._last_shotnum_cache, {})
+
         # remove datasets
         del self.f['d1']
         del self.f['d2']
@@ -669,13 +710,21 @@ class TestConditionShotnum(TestBase):
              np.array([10], np.uint32)),
             (np.array([20, 30], np.int32),
              np.array([20, 30], np.uint32)),
+            (np.array([30, -2, 20], np.int32),
+             np.array([20, 30], np.uint32)),
+            (np.array([5, 2, 5, 0, 2], np.int32),
+             np.array([2, 5], np.uint32)),
         ]
         for shotnum, ex_sn in sn:
+            og_shotnum = shotnum.copy()
             _sn = condition_shotnum(shotnum, {}, {})
 
             self.assertIsInstance(_sn, np.ndarray)
             self.assertTrue(np.array_equal(_sn, ex_sn))
 
+            # input array is not modified
+            self.assertTrue(np.array_equal(shotnum, og_shotnum))
+
     def test_shotnum_invalid(self):
         # shotnum not int, List[int], slice, or ndarray
         sn = [1.5, None, True, {}]
@@ -65,6 +65,7 @@ class File(BaseFile):
                                  control_path=self.CONTROL_PATH,
                                  digitizer_path=self.DIGITIZER_PATH,
                                  msi_path=self.MSI_PATH)
+        self._reset_map_caches()
 
     @property
     def file_map(self) -> LaPDMap:
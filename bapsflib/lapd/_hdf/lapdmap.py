@@ -88,22 +88,22 @@ class LaPDMap(HDFMap):
         }
 
         # assign values
-        for key, val in \
-                self._hdf_obj[
-                    self.DEVICE_PATHS['digitizer']].attrs.items():
+        # - look up the known attributes directly instead of reading
+        #   every attribute of the group
+        attrs = self._hdf_obj[self.DEVICE_PATHS['digitizer']].attrs
+        for key, attr_name in (
+                ('investigator', 'Investigator'),
+                ('exp name', 'Experiment name'),
+                ('exp description', 'Experiment description'),
+                ('exp set name', 'Experiment set name'),
+                ('exp set description', 'Experiment set description')):
+            if attr_name not in attrs:
+                continue
+
+            val = attrs[attr_name]
             if isinstance(val, (np.bytes_, bytes)):
                 val = val.decode('utf-8')
-
-            if key == 'Investigator':
-                exp_info['investigator'] = val
-            elif key == 'Experiment name':
-                exp_info['exp name'] = val
-            elif key == 'Experiment description':
-                exp_info['exp description'] = val
-            elif key == 'Experiment set name':
-                exp_info['exp set name'] = val
-            elif key == 'Experiment set description':
-                exp_info['exp set description'] = val
+            exp_info[key] = val
 
         # return
         return exp_info